@@ -270,6 +270,9 @@ async def radarr_webhook(request: Request, background_tasks: BackgroundTasks, de
             print("WARNING: No IMDb ID in Radarr webhook movie data")
             return {"status": "error", "message": "No IMDb ID"}
         
+        # The movie just changed in Radarr; don't serve its cached record or lookup
+        dependencies["movie_processor"].radarr.invalidate(movie_data.get("id"), imdb_id)
+        
         # Get movie path and map it
         movie_path = movie_data.get("folderPath") or movie_data.get("path", "")
         if not movie_path:
@@ -392,12 +395,8 @@ async def debug_movie_import_date(imdb_id: str, dependencies: dict):
                 "radarr_configured": False
             }
         
-        # Create Radarr client
-        from clients.radarr_client import RadarrClient
-        radarr_client = RadarrClient(
-            os.environ.get("RADARR_URL"),
-            os.environ.get("RADARR_API_KEY")
-        )
+        # Reuse the processor's client and its pooled connections
+        radarr_client = movie_processor.radarr
         
         # Look up movie
         movie_obj = radarr_client.movie_by_imdb(imdb_id)
@@ -2008,6 +2007,14 @@ def register_routes(app, dependencies: dict):
     async def _debug_tmdb_lookup(imdb_id: str):
         return await debug_tmdb_lookup(imdb_id, dependencies)
 
+    # The date-options stream needs the movie processor's clients, which only
+    # the core container has; the web container answers it with a stub
+    from api.web_routes import stream_movie_date_options
+
+    @app.get("/api/movies/{imdb_id}/date-options/stream")
+    async def _movie_date_options_stream(imdb_id: str):
+        return await stream_movie_date_options(dependencies, imdb_id)
+
     # Include monitoring routes
     from api.monitoring_routes import router as monitoring_router
     app.include_router(monitoring_router)
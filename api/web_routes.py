@@ -2,13 +2,75 @@
 Web interface API routes for NFOGuard database management
 Provides endpoints for the web-based database manipulation interface
 """
+import os
+import re
 import json
-from datetime import datetime, timezone
+import time
+import hashlib
+import asyncio
+import logging
+from datetime import date, datetime, timezone
 from typing import List, Optional, Dict, Any
-from fastapi import HTTPException, Query
+import aiohttp
+import orjson
+from fastapi import BackgroundTasks, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pathlib import Path
 
 from api.models import *
+from utils.cache import TTLCache, cached_call
+from utils.file_utils import MediaPathIndex
+
+logger = logging.getLogger(__name__)
+
+# Results of external lookups used by the date-options endpoints. Metadata
+# from TMDB/OMDb rarely changes; Radarr/Sonarr import history can, so it
+# expires sooner.
+_EXTERNAL_LOOKUP_CACHE = TTLCache(maxsize=10_000, ttl=24 * 3600)
+_ARR_LOOKUP_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+
+# Usernames for recently validated session tokens, so the polled
+# /api/auth/status endpoint doesn't revalidate the session on every call.
+# Only successful lookups are stored; logout evicts the token.
+_AUTH_STATUS_CACHE = TTLCache(maxsize=1024, ttl=2.0)
+
+_OMDB_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# Description templates for date options, keyed by option type
+_OPTION_DESCRIPTIONS = {
+    "digital_release": "Use the movie's actual release date: {date} (instead of download date)".format,
+    "radarr_import": "Import date from Radarr: {date} (source: {source})".format,
+    "tmdb_digital": "Digital release date from TMDB: {date}".format,
+    "omdb_release": "Release date from OMDb: {date}".format,
+    "episode_current": "Currently using: {source}".format,
+    "airdate": "Use original air date: {date}".format,
+    "sonarr_import": "Import date from Sonarr: {date}".format,
+    "sonarr_air": "Air date from Sonarr: {date}".format,
+    "sonarr_air_fallback": "Use Sonarr air date as import date: {date}".format,
+    "tmdb_air": "Air date from TMDB: {date}".format,
+    "airdate_tmdb": "Use air date from TMDB: {date}".format,
+    "external_air": "Air date from external sources: {date}".format,
+    "airdate_external": "Use air date from external sources: {date}".format,
+}
+_MANUAL_OPTION_DESCRIPTION = "Enter custom date and time"
+
+
+def _differs(current_date_str: str, new_iso: str) -> bool:
+    """True if there is no current date or new_iso falls on a different day"""
+    return not current_date_str or current_date_str != new_iso[:10]
+
+
+def _parse_omdb_date(value: str) -> Optional[str]:
+    """Convert an OMDb date such as "27 Jul 2018" to YYYY-MM-DD, or None if malformed"""
+    try:
+        day, month, year = value.split()
+        return date(int(year), _OMDB_MONTHS[month.title()], int(day)).isoformat()
+    except (KeyError, ValueError):
+        return None
 
 
 def map_source_to_description(source: str) -> str:
@@ -59,6 +121,85 @@ def map_source_to_description(source: str) -> str:
     return source.title()
 
 
+def _source_descriptions(rows) -> Dict[Optional[str], str]:
+    """
+    Map each distinct source in a result set to its description
+    
+    A page holds thousands of rows but only a handful of distinct sources,
+    so rows look their description up in this dict instead of each calling
+    map_source_to_description().
+    """
+    return {source: map_source_to_description(source) for source in {row.get('source') for row in rows}}
+
+
+_IMDB_PREFIX_RE = re.compile(r'^tt\d')
+
+
+def _imdb_search_pattern(imdb_search: str) -> str:
+    """
+    Build the LIKE pattern for an IMDb ID search
+    
+    IMDb IDs always start with "tt", so a search that already starts with
+    "tt<digit>" can only ever match as a prefix. Anchoring the pattern lets
+    PostgreSQL use the imdb_id pattern index instead of a sequential scan.
+    """
+    if _IMDB_PREFIX_RE.match(imdb_search):
+        return f"{imdb_search}%"
+    return f"%{imdb_search}%"
+
+
+# (has_date, source_filter, search, imdb_search) -> (count SQL, list SQL)
+_MOVIES_QUERY_CACHE: Dict[tuple, tuple] = {}
+
+
+def _movies_list_queries(has_date: Optional[bool], source_filter: bool,
+                         search: bool, imdb_search: bool) -> tuple:
+    """
+    Get the (count, list) SQL for a movies list filter shape
+    
+    There are only 24 filter combinations, so the SQL for each is built once
+    and reused. Stable SQL text also keeps PostgreSQL's plan caching effective.
+    """
+    key = (has_date, source_filter, search, imdb_search)
+    queries = _MOVIES_QUERY_CACHE.get(key)
+    if queries is not None:
+        return queries
+    
+    where_conditions = []
+    
+    if has_date is not None:
+        if has_date:
+            # PostgreSQL - NULL handling
+            where_conditions.append("dateadded IS NOT NULL")
+        else:
+            # PostgreSQL - NULL handling
+            where_conditions.append("dateadded IS NULL")
+    
+    if source_filter:
+        where_conditions.append("source = %s")
+    
+    if search:
+        where_conditions.append("(imdb_id ILIKE %s OR path ILIKE %s)")
+    
+    if imdb_search:
+        where_conditions.append("imdb_id LIKE %s")
+    
+    where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+    
+    queries = (
+        f"SELECT COUNT(*) FROM movies WHERE {where_clause}",
+        f"""
+            SELECT imdb_id, path, released, dateadded, source, has_video_file, last_updated
+            FROM movies 
+            WHERE {where_clause}
+            ORDER BY last_updated DESC
+            LIMIT %s OFFSET %s
+        """
+    )
+    _MOVIES_QUERY_CACHE[key] = queries
+    return queries
+
+
 # ---------------------------
 # Database Query Endpoints
 # ---------------------------
@@ -76,58 +217,39 @@ async def get_movies_list(dependencies: dict,
     with db.get_connection() as conn:
         cursor = conn.cursor()
         
-        # Build dynamic query
-        where_conditions = []
+        # Parameters vary per request; the SQL text only varies by filter shape
+        count_query, query = _movies_list_queries(
+            has_date, bool(source_filter), bool(search), bool(imdb_search)
+        )
         params = []
         
-        if has_date is not None:
-            if has_date:
-                # PostgreSQL - NULL handling
-                where_conditions.append("dateadded IS NOT NULL")
-            else:
-                # PostgreSQL - NULL handling
-                where_conditions.append("dateadded IS NULL")
-        
         if source_filter:
-            where_conditions.append("source = %s")
             params.append(source_filter)
         
         if search:
-            where_conditions.append("(imdb_id LIKE %s OR path LIKE %s)")
             params.extend([f"%{search}%", f"%{search}%"])
         
         if imdb_search:
-            where_conditions.append("imdb_id LIKE %s")
-            params.append(f"%{imdb_search}%")
-        
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+            params.append(_imdb_search_pattern(imdb_search))
         
         # Get total count
-        count_query = f"SELECT COUNT(*) FROM movies WHERE {where_clause}"
         cursor.execute(count_query, params)
         total_count = db._get_first_value(cursor.fetchone())
         
         # Get paginated results - PostgreSQL
-        query = f"""
-            SELECT imdb_id, path, released, dateadded, source, has_video_file, last_updated
-            FROM movies 
-            WHERE {where_clause}
-            ORDER BY last_updated DESC
-            LIMIT %s OFFSET %s
-        """
         cursor.execute(query, params + [limit, skip])
         
-        movies = []
-        for row in cursor.fetchall():
-            movie = dict(row)
+        movies = cursor.fetchall()
+        source_descriptions = _source_descriptions(movies)
+        # RealDictRow rows are dicts already - annotate them in place instead of copying
+        for movie in movies:
             # Extract title from path for display
             try:
                 movie['title'] = Path(movie['path']).name if movie['path'] else movie['imdb_id']
             except:
                 movie['title'] = movie['imdb_id']
             # Map source to user-friendly description
-            movie['source_description'] = map_source_to_description(movie.get('source'))
-            movies.append(movie)
+            movie['source_description'] = source_descriptions[movie.get('source')]
         
         return {
             "movies": movies,
@@ -159,78 +281,64 @@ async def get_tv_series_list(dependencies: dict,
         # Build dynamic query
         where_conditions = []
         params = []
-        having_conditions = []
         
         if search:
-            where_conditions.append("(s.imdb_id LIKE %s OR s.path LIKE %s)")
+            where_conditions.append("(s.imdb_id ILIKE %s OR s.path ILIKE %s)")
             params.extend([f"%{search}%", f"%{search}%"])
             
         if imdb_search:
             where_conditions.append("s.imdb_id LIKE %s")
-            params.append(f"%{imdb_search}%")
+            params.append(_imdb_search_pattern(imdb_search))
             
         if source_filter:
             # Need to check episodes for source filter
-            where_conditions.append("e.source = %s")
+            where_conditions.append("EXISTS (SELECT 1 FROM episodes e WHERE e.imdb_id = s.imdb_id AND e.source = %s)")
             params.append(source_filter)
             
+        # Episode counts come from the trigger-maintained series_date_stats
+        # table, so date filtering is a plain WHERE instead of GROUP BY/HAVING
         if date_filter:
             if date_filter == "complete":
                 # All episodes have dates
-                having_conditions.append("COUNT(e.episode) > 0 AND COUNT(CASE WHEN e.dateadded IS NULL THEN 1 END) = 0")
+                where_conditions.append("sds.total_eps > 0 AND sds.eps_with_dates = sds.total_eps")
             elif date_filter == "incomplete":
                 # Some episodes have dates, some don't
-                having_conditions.append("COUNT(e.episode) > 0 AND COUNT(CASE WHEN e.dateadded IS NOT NULL THEN 1 END) > 0 AND COUNT(CASE WHEN e.dateadded IS NULL THEN 1 END) > 0")
+                where_conditions.append("sds.total_eps > 0 AND sds.eps_with_dates > 0 AND sds.eps_with_dates < sds.total_eps")
             elif date_filter == "none":
                 # No episodes have dates
-                having_conditions.append("COUNT(e.episode) > 0 AND COUNT(CASE WHEN e.dateadded IS NOT NULL THEN 1 END) = 0")
+                where_conditions.append("sds.total_eps > 0 AND sds.eps_with_dates = 0")
         
         where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-        having_clause = " AND ".join(having_conditions) if having_conditions else ""
         
         # Get total count with same filtering logic as main query
-        if having_clause:
-            # When using HAVING clause, need to count filtered results
-            count_query = f"""
-                SELECT COUNT(*) FROM (
-                    SELECT s.imdb_id
-                    FROM series s
-                    LEFT JOIN episodes e ON s.imdb_id = e.imdb_id
-                    WHERE {where_clause}
-                    GROUP BY s.imdb_id
-                    HAVING {having_clause}
-                ) filtered_series
-            """
-            cursor.execute(count_query, params)
-        else:
-            # Simple count when no HAVING clause
-            count_query = f"SELECT COUNT(*) FROM series s WHERE {where_clause}"
-            cursor.execute(count_query, params)
+        count_query = f"""
+            SELECT COUNT(*)
+            FROM series s
+            LEFT JOIN series_date_stats sds ON s.imdb_id = sds.imdb_id
+            WHERE {where_clause}
+        """
+        cursor.execute(count_query, params)
         total_count = db._get_first_value(cursor.fetchone())
         
-        # Get series with episode statistics
-        having_part = f" HAVING {having_clause}" if having_clause else ""
-        # PostgreSQL query
+        # Get series with episode statistics - PostgreSQL
         query = f"""
             SELECT 
                 s.imdb_id, 
                 s.path, 
                 s.last_updated,
-                COUNT(e.episode) as total_episodes,
-                COUNT(CASE WHEN e.dateadded IS NOT NULL THEN 1 END) as episodes_with_dates,
-                COUNT(CASE WHEN e.has_video_file = TRUE THEN 1 END) as episodes_with_video
+                COALESCE(sds.total_eps, 0) as total_episodes,
+                COALESCE(sds.eps_with_dates, 0) as episodes_with_dates,
+                COALESCE(sds.eps_with_video, 0) as episodes_with_video
             FROM series s
-            LEFT JOIN episodes e ON s.imdb_id = e.imdb_id
+            LEFT JOIN series_date_stats sds ON s.imdb_id = sds.imdb_id
             WHERE {where_clause}
-            GROUP BY s.imdb_id, s.path, s.last_updated{having_part}
             ORDER BY s.last_updated DESC
             LIMIT %s OFFSET %s
         """
         cursor.execute(query, params + [limit, skip])
         
         series = []
-        for row in cursor.fetchall():
-            series_data = dict(row)
+        for series_data in cursor.fetchall():
             # Extract title from path
             try:
                 series_data['title'] = Path(series_data['path']).name if series_data['path'] else series_data['imdb_id']
@@ -271,59 +379,55 @@ async def debug_series_date_distribution(dependencies: dict):
     """Debug function to show TV series date distribution"""
     db = dependencies["db"]
     
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Get series with episode date statistics
-        cursor.execute("""
-            SELECT 
-                s.imdb_id,
-                s.path,
-                COUNT(e.episode) as total_episodes,
-                COUNT(CASE WHEN e.dateadded IS NOT NULL THEN 1 END) as episodes_with_dates,
-                COUNT(CASE WHEN e.dateadded IS NULL THEN 1 END) as episodes_without_dates
-            FROM series s
-            LEFT JOIN episodes e ON s.imdb_id = e.imdb_id
-            GROUP BY s.imdb_id, s.path
-            HAVING COUNT(e.episode) > 0
-            ORDER BY total_episodes DESC
-            LIMIT 50
-        """)
-        
-        series_stats = []
-        complete_count = 0
-        incomplete_count = 0 
-        none_count = 0
+    # Get series with episode date statistics
+    rows = db.iter_query("series_date_distribution", """
+        SELECT 
+            s.imdb_id,
+            s.path,
+            COUNT(e.episode) as total_episodes,
+            COUNT(CASE WHEN e.dateadded IS NOT NULL THEN 1 END) as episodes_with_dates,
+            COUNT(CASE WHEN e.dateadded IS NULL THEN 1 END) as episodes_without_dates
+        FROM series s
+        LEFT JOIN episodes e ON s.imdb_id = e.imdb_id
+        GROUP BY s.imdb_id, s.path
+        HAVING COUNT(e.episode) > 0
+        ORDER BY total_episodes DESC
+        LIMIT 50
+    """)
+    
+    series_stats = []
+    complete_count = 0
+    incomplete_count = 0 
+    none_count = 0
+    
+    for stats in rows:
+        total = stats['total_episodes']
+        with_dates = stats['episodes_with_dates']
+        without_dates = stats['episodes_without_dates']
         
-        for row in cursor.fetchall():
-            stats = dict(row)
-            total = stats['total_episodes']
-            with_dates = stats['episodes_with_dates']
-            without_dates = stats['episodes_without_dates']
+        if without_dates == 0:
+            category = "complete"
+            complete_count += 1
+        elif with_dates == 0:
+            category = "none"
+            none_count += 1
+        else:
+            category = "incomplete"
+            incomplete_count += 1
             
-            if without_dates == 0:
-                category = "complete"
-                complete_count += 1
-            elif with_dates == 0:
-                category = "none"
-                none_count += 1
-            else:
-                category = "incomplete"
-                incomplete_count += 1
-                
-            stats['category'] = category
-            stats['title'] = stats['path'].split('/')[-1] if stats['path'] else stats['imdb_id']
-            series_stats.append(stats)
-        
-        return {
-            "series_sample": series_stats[:20],  # First 20 for debugging
-            "distribution": {
-                "complete": complete_count,
-                "incomplete": incomplete_count,
-                "none": none_count,
-                "total": complete_count + incomplete_count + none_count
-            }
+        stats['category'] = category
+        stats['title'] = stats['path'].split('/')[-1] if stats['path'] else stats['imdb_id']
+        series_stats.append(stats)
+    
+    return {
+        "series_sample": series_stats[:20],  # First 20 for debugging
+        "distribution": {
+            "complete": complete_count,
+            "incomplete": incomplete_count,
+            "none": none_count,
+            "total": complete_count + incomplete_count + none_count
         }
+    }
 
 
 async def get_series_episodes(dependencies: dict, imdb_id: str):
@@ -339,26 +443,20 @@ async def get_series_episodes(dependencies: dict, imdb_id: str):
         if not series_row:
             raise HTTPException(status_code=404, detail="Series not found")
         
-        series_info = dict(series_row)
+        series_info = series_row
         try:
             series_info['title'] = Path(series_info['path']).name if series_info['path'] else imdb_id
         except:
             series_info['title'] = imdb_id
         
         # Get episodes - PostgreSQL
-        cursor.execute("""
-            SELECT season, episode, aired, dateadded, source, has_video_file, last_updated
-            FROM episodes 
-            WHERE imdb_id = %s
-            ORDER BY season, episode
-        """, (imdb_id,))
+        db.execute_prepared(cursor, "get_series_episodes", (imdb_id,))
         
-        episodes = []
-        for row in cursor.fetchall():
-            episode = dict(row)
+        episodes = cursor.fetchall()
+        source_descriptions = _source_descriptions(episodes)
+        for episode in episodes:
             # Map source to user-friendly description
-            episode['source_description'] = map_source_to_description(episode.get('source'))
-            episodes.append(episode)
+            episode['source_description'] = source_descriptions[episode.get('source')]
         
         return {
             "series": series_info,
@@ -366,147 +464,178 @@ async def get_series_episodes(dependencies: dict, imdb_id: str):
         }
 
 
+_MISSING_MOVIES_QUERY = """
+    SELECT imdb_id, path, released, source, last_updated
+    FROM movies 
+    WHERE dateadded IS NULL OR source = 'no_valid_date_source'
+    ORDER BY last_updated DESC
+"""
+
+_MISSING_EPISODES_QUERY = """
+    SELECT e.imdb_id, e.season, e.episode, e.aired, e.source, e.last_updated, s.path
+    FROM episodes e
+    JOIN series s ON e.imdb_id = s.imdb_id
+    WHERE e.dateadded IS NULL OR e.source = 'no_valid_date_source'
+    ORDER BY e.last_updated DESC
+"""
+
+
+def _iter_missing_movies(db):
+    """Yield movies missing dateadded, streamed from a server-side cursor"""
+    source_descriptions = {}
+    for movie in db.iter_query("missing_movies", _MISSING_MOVIES_QUERY):
+        try:
+            movie['title'] = Path(movie['path']).name if movie['path'] else movie['imdb_id']
+        except:
+            movie['title'] = movie['imdb_id']
+        # Map source to user-friendly description
+        source = movie.get('source')
+        if source not in source_descriptions:
+            source_descriptions[source] = map_source_to_description(source)
+        movie['source_description'] = source_descriptions[source]
+        yield movie
+
+
+def _iter_missing_episodes(db):
+    """Yield episodes missing dateadded, streamed from a server-side cursor"""
+    source_descriptions = {}
+    for episode in db.iter_query("missing_episodes", _MISSING_EPISODES_QUERY):
+        try:
+            episode['series_title'] = Path(episode['path']).name if episode['path'] else episode['imdb_id']
+        except:
+            episode['series_title'] = episode['imdb_id']
+        # Map source to user-friendly description
+        source = episode.get('source')
+        if source not in source_descriptions:
+            source_descriptions[source] = map_source_to_description(source)
+        episode['source_description'] = source_descriptions[source]
+        yield episode
+
+
+def _get_missing_dates_summary(db, movies_missing: int, episodes_missing: int) -> Dict[str, Any]:
+    """Build the summary block of the missing dates report"""
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Summary statistics - one round-trip, one scan per table
+        db.execute_prepared(cursor, "missing_dates_summary")
+        counts = cursor.fetchone()
+    
+    return {
+        "movies_with_dates": counts["movies_with_dates"],
+        "movies_missing_dates": movies_missing,
+        "total_movies": counts["total_movies"],
+        "episodes_with_dates": counts["episodes_with_dates"],
+        "episodes_missing_dates": episodes_missing,
+        "total_episodes": counts["total_episodes"]
+    }
+
+
 async def get_missing_dates_report(dependencies: dict):
     """Generate report of movies and episodes missing dateadded"""
     db = dependencies["db"]
     
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Movies without dates - PostgreSQL
-        cursor.execute("""
-            SELECT imdb_id, path, released, source, last_updated
-            FROM movies 
-            WHERE dateadded IS NULL OR source = 'no_valid_date_source'
-            ORDER BY last_updated DESC
-        """)
-        movies_missing = []
-        for row in cursor.fetchall():
-            movie = dict(row)
-            try:
-                movie['title'] = Path(movie['path']).name if movie['path'] else movie['imdb_id']
-            except:
-                movie['title'] = movie['imdb_id']
-            # Map source to user-friendly description
-            movie['source_description'] = map_source_to_description(movie.get('source'))
-            movies_missing.append(movie)
-        
-        # Episodes without dates - PostgreSQL
-        cursor.execute("""
-            SELECT e.imdb_id, e.season, e.episode, e.aired, e.source, e.last_updated, s.path
-            FROM episodes e
-            JOIN series s ON e.imdb_id = s.imdb_id
-            WHERE e.dateadded IS NULL OR e.source = 'no_valid_date_source'
-            ORDER BY e.last_updated DESC
-        """)
-        episodes_missing = []
-        for row in cursor.fetchall():
-            episode = dict(row)
-            try:
-                episode['series_title'] = Path(episode['path']).name if episode['path'] else episode['imdb_id']
-            except:
-                episode['series_title'] = episode['imdb_id']
-            # Map source to user-friendly description
-            episode['source_description'] = map_source_to_description(episode.get('source'))
-            episodes_missing.append(episode)
-        
-        # Summary statistics - PostgreSQL
-        cursor.execute("SELECT COUNT(*) FROM movies WHERE dateadded IS NOT NULL")
-        movies_with_dates = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM movies")
-        total_movies = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM episodes WHERE dateadded IS NOT NULL")
-        episodes_with_dates = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM episodes")
-        total_episodes = db._get_first_value(cursor.fetchone())
-        
-        return {
-            "summary": {
-                "movies_with_dates": movies_with_dates,
-                "movies_missing_dates": len(movies_missing),
-                "total_movies": total_movies,
-                "episodes_with_dates": episodes_with_dates,
-                "episodes_missing_dates": len(episodes_missing),
-                "total_episodes": total_episodes
-            },
-            "movies_missing": movies_missing,
-            "episodes_missing": episodes_missing
-        }
+    movies_missing = list(_iter_missing_movies(db))
+    episodes_missing = list(_iter_missing_episodes(db))
+    
+    return {
+        "summary": _get_missing_dates_summary(db, len(movies_missing), len(episodes_missing)),
+        "movies_missing": movies_missing,
+        "episodes_missing": episodes_missing
+    }
 
 
-async def get_dashboard_stats(dependencies: dict):
-    """Get comprehensive dashboard statistics"""
+def stream_missing_dates_report(dependencies: dict) -> StreamingResponse:
+    """
+    Stream the missing dates report as NDJSON
+    
+    Each line is one JSON object tagged with a ``type`` of ``movie_missing``,
+    ``episode_missing`` or ``summary`` (always last), so large reports never
+    have to be materialized in memory.
+    """
     db = dependencies["db"]
     
-    # Get basic stats from existing method
-    stats = db.get_stats()
+    def generate():
+        movies_missing = 0
+        for movie in _iter_missing_movies(db):
+            movies_missing += 1
+            yield json.dumps({"type": "movie_missing", **jsonable_encoder(movie)}) + "\n"
+        
+        episodes_missing = 0
+        for episode in _iter_missing_episodes(db):
+            episodes_missing += 1
+            yield json.dumps({"type": "episode_missing", **jsonable_encoder(episode)}) + "\n"
+        
+        summary = _get_missing_dates_summary(db, movies_missing, episodes_missing)
+        yield json.dumps({"type": "summary", **summary}) + "\n"
     
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _date_counts(db, media_type: str) -> Dict[str, Any]:
+    """Count dated/undated/no-valid-source rows of movies or episodes in one scan"""
     with db.get_connection() as conn:
         cursor = conn.cursor()
-        
-        # Enhanced statistics - PostgreSQL
-        cursor.execute("SELECT COUNT(*) FROM movies WHERE dateadded IS NOT NULL")
-        movies_with_dates = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM movies WHERE dateadded IS NULL OR source = 'no_valid_date_source'")
-        movies_without_dates = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM episodes WHERE dateadded IS NOT NULL")
-        episodes_with_dates = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM episodes WHERE dateadded IS NULL OR source = 'no_valid_date_source'")
-        episodes_without_dates = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM movies WHERE source = 'no_valid_date_source'")
-        movies_no_valid_source = db._get_first_value(cursor.fetchone())
-        
-        cursor.execute("SELECT COUNT(*) FROM episodes WHERE source = 'no_valid_date_source'")
-        episodes_no_valid_source = db._get_first_value(cursor.fetchone())
-        
-        # Recent activity (last 7 days)
-        cursor.execute("""
-            SELECT COUNT(*) FROM processing_history 
-            WHERE processed_at > NOW() - INTERVAL '7 days'
-        """)
-        recent_activity = db._get_first_value(cursor.fetchone())
-        
-        # Source distribution for movies
-        cursor.execute("""
-            SELECT source, COUNT(*) as count
-            FROM movies 
-            WHERE source IS NOT NULL
-            GROUP BY source
-            ORDER BY count DESC
-        """)
-        movie_sources = [{"source": list(row.values())[0], "source_description": map_source_to_description(list(row.values())[0]), "count": list(row.values())[1]} for row in cursor.fetchall()]
-        
-        # Source distribution for episodes
-        cursor.execute("""
+        db.execute_prepared(cursor, f"{media_type}_date_counts")
+        return cursor.fetchone()
+
+
+def _recent_activity_count(db) -> int:
+    """Count processing history entries from the last 7 days"""
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        db.execute_prepared(cursor, "recent_activity_count")
+        return db._get_first_value(cursor.fetchone())
+
+
+def _source_distribution(db, table: str) -> List[Dict[str, Any]]:
+    """Get per-source row counts for a media table"""
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
             SELECT source, COUNT(*) as count
-            FROM episodes 
+            FROM {table} 
             WHERE source IS NOT NULL
             GROUP BY source
             ORDER BY count DESC
         """)
-        episode_sources = [{"source": list(row.values())[0], "source_description": map_source_to_description(list(row.values())[0]), "count": list(row.values())[1]} for row in cursor.fetchall()]
-        
+        return [{"source": list(row.values())[0], "source_description": map_source_to_description(list(row.values())[0]), "count": list(row.values())[1]} for row in cursor.fetchall()]
+
+
+async def get_dashboard_stats(dependencies: dict):
+    """Get comprehensive dashboard statistics"""
+    db = dependencies["db"]
+    loop = asyncio.get_event_loop()
+    
+    # The queries are independent, so run them concurrently in the default
+    # executor. Connections are thread-local, so each worker thread issues
+    # its query on its own PostgreSQL connection.
+    stats, movie_counts, episode_counts, recent_activity, movie_sources, episode_sources = await asyncio.gather(
+        loop.run_in_executor(None, db.get_stats),
+        loop.run_in_executor(None, _date_counts, db, "movie"),
+        loop.run_in_executor(None, _date_counts, db, "episode"),
+        loop.run_in_executor(None, _recent_activity_count, db),
+        loop.run_in_executor(None, _source_distribution, db, "movies"),
+        loop.run_in_executor(None, _source_distribution, db, "episodes")
+    )
+    
+    movies_without_dates = movie_counts["without_dates"]
+    episodes_without_dates = episode_counts["without_dates"]
+    
     # Calculate total missing dates (movies + episodes)
     total_missing_dates = movies_without_dates + episodes_without_dates
     
     # Combine with enhanced stats
     stats.update({
-        "movies_with_dates": movies_with_dates,
+        "movies_with_dates": movie_counts["with_dates"],
         "movies_without_dates": movies_without_dates,
         "movies_missing_dates": movies_without_dates,  # Keep for backward compatibility
-        "episodes_with_dates": episodes_with_dates,
+        "episodes_with_dates": episode_counts["with_dates"],
         "episodes_without_dates": episodes_without_dates,
         "episodes_missing_dates": episodes_without_dates,  # Keep for backward compatibility
         "total_missing_dates": total_missing_dates,
-        "movies_no_valid_source": movies_no_valid_source,
-        "episodes_no_valid_source": episodes_no_valid_source,
+        "movies_no_valid_source": movie_counts["no_valid_source"],
+        "episodes_no_valid_source": episode_counts["no_valid_source"],
         "recent_activity_count": recent_activity,
         "movie_sources": movie_sources,
         "episode_sources": episode_sources
@@ -523,27 +652,23 @@ async def update_movie_date(dependencies: dict, imdb_id: str, dateadded: Optiona
     """Update dateadded for a specific movie"""
     db = dependencies["db"]
     
-    # Debug logging to track the issue
-    print(f"🔍 UPDATE_MOVIE_DATE: imdb_id={imdb_id}, dateadded={dateadded}, source={source}")
-    print(f"   - dateadded type: {type(dateadded)}")
-    print(f"   - dateadded repr: {repr(dateadded)}")
+    logger.debug("UPDATE_MOVIE_DATE: imdb_id=%s dateadded=%r source=%s", imdb_id, dateadded, source)
     
     # Validate inputs
     if not imdb_id or not imdb_id.strip():
-        print(f"❌ Invalid imdb_id: {repr(imdb_id)}")
+        logger.debug("Invalid imdb_id: %r", imdb_id)
         raise HTTPException(status_code=422, detail="Invalid IMDb ID")
     
     if not source or not source.strip():
-        print(f"❌ Invalid source: {repr(source)}")
+        logger.debug("Invalid source: %r", source)
         raise HTTPException(status_code=422, detail="Invalid source")
     
     # Validate date format if provided
     if dateadded:
         try:
-            from datetime import datetime
             datetime.fromisoformat(dateadded.replace('Z', '+00:00'))
         except Exception as e:
-            print(f"❌ Invalid dateadded format: {repr(dateadded)} - {e}")
+            logger.debug("Invalid dateadded format: %r - %s", dateadded, e)
             raise HTTPException(status_code=422, detail=f"Invalid date format: {dateadded}")
     
     # Validate movie exists
@@ -560,6 +685,9 @@ async def update_movie_date(dependencies: dict, imdb_id: str, dateadded: Optiona
         has_video_file=movie.get('has_video_file', False)
     )
     
+    # Re-read Radarr the next time the date picker is opened
+    _ARR_LOOKUP_CACHE.pop(("radarr_import", imdb_id))
+    
     # Add to processing history
     try:
         db.add_processing_history(
@@ -569,10 +697,9 @@ async def update_movie_date(dependencies: dict, imdb_id: str, dateadded: Optiona
             details={"old_source": movie.get('source'), "new_source": source, "dateadded": dateadded}
         )
     except Exception as e:
-        print(f"⚠️ Failed to add processing history: {e}")
+        logger.warning("Failed to add processing history: %s", e)
         # Don't fail the entire update for history logging issues
     
-    print(f"✅ Successfully updated movie {imdb_id}")
     return {"status": "success", "message": f"Updated movie {imdb_id}"}
 
 
@@ -597,6 +724,9 @@ async def update_episode_date(dependencies: dict, imdb_id: str, season: int, epi
         has_video_file=episode_data.get('has_video_file', False)
     )
     
+    # Re-read Sonarr the next time the date picker is opened
+    _ARR_LOOKUP_CACHE.pop(("sonarr_import", imdb_id, season, episode))
+    
     # Create/update NFO file with new data
     nfo_manager = dependencies["nfo_manager"]
     config = dependencies["config"]
@@ -604,14 +734,10 @@ async def update_episode_date(dependencies: dict, imdb_id: str, season: int, epi
     if config.manage_nfo:
         try:
             # Find the series directory based on IMDb ID
-            series_path = None
-            for tv_path in config.tv_paths:
-                for series_dir in Path(tv_path).iterdir():
-                    if series_dir.is_dir() and imdb_id.lower() in series_dir.name.lower():
-                        series_path = series_dir
-                        break
-                if series_path:
-                    break
+            series_path_index = dependencies.get("series_path_index")
+            if series_path_index is None:
+                series_path_index = dependencies["series_path_index"] = MediaPathIndex(config.tv_paths)
+            series_path = series_path_index.get(imdb_id)
             
             if series_path:
                 season_dir = series_path / config.tv_season_dir_format.format(season=season)
@@ -625,14 +751,14 @@ async def update_episode_date(dependencies: dict, imdb_id: str, season: int, epi
                         source=source,
                         lock_metadata=config.lock_metadata
                     )
-                    print(f"✅ Updated NFO file for {imdb_id} S{season:02d}E{episode:02d}")
+                    logger.debug("Updated NFO file for %s S%02dE%02d", imdb_id, season, episode)
                 else:
-                    print(f"⚠️ Season directory not found: {season_dir}")
+                    logger.warning("Season directory not found: %s", season_dir)
             else:
-                print(f"⚠️ Series directory not found for {imdb_id}")
+                logger.warning("Series directory not found for %s", imdb_id)
                 
         except Exception as e:
-            print(f"❌ Error updating NFO file for {imdb_id} S{season:02d}E{episode:02d}: {e}")
+            logger.error("Error updating NFO file for %s S%02dE%02d: %s", imdb_id, season, episode, e)
     
     # Add to processing history
     db.add_processing_history(
@@ -658,42 +784,7 @@ async def bulk_update_source(dependencies: dict, media_type: str, old_source: st
     if media_type not in ["movies", "episodes"]:
         raise HTTPException(status_code=400, detail="media_type must be 'movies' or 'episodes'")
     
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        
-        if media_type == "movies":
-            # Update movies
-            cursor.execute("UPDATE movies SET source = %s WHERE source = %s", (new_source, old_source))
-            updated_count = cursor.rowcount
-            
-            # Add history entries
-            cursor.execute("SELECT imdb_id FROM movies WHERE source = %s", (new_source,))
-            for row in cursor.fetchall():
-                db.add_processing_history(
-                    imdb_id=row[0],
-                    media_type="movie",
-                    event_type="bulk_source_update",
-                    details={"old_source": old_source, "new_source": new_source}
-                )
-        else:
-            # Update episodes
-            cursor.execute("UPDATE episodes SET source = %s WHERE source = %s", (new_source, old_source))
-            updated_count = cursor.rowcount
-            
-            # Add history entries
-            cursor.execute("SELECT imdb_id, season, episode FROM episodes WHERE source = %s", (new_source,))
-            for row in cursor.fetchall():
-                db.add_processing_history(
-                    imdb_id=row[0],
-                    media_type="episode",
-                    event_type="bulk_source_update",
-                    details={
-                        "season": row[1],
-                        "episode": row[2],
-                        "old_source": old_source, 
-                        "new_source": new_source
-                    }
-                )
+    updated_count = db.bulk_update_source(media_type, old_source, new_source)
     
     return {
         "status": "success", 
@@ -701,28 +792,14 @@ async def bulk_update_source(dependencies: dict, media_type: str, old_source: st
     }
 
 
-async def get_movie_date_options(dependencies: dict, imdb_id: str):
-    """Get available date options for a movie (Radarr import, digital release, etc.)"""
-    db = dependencies["db"]
-    nfo_manager = dependencies["nfo_manager"]
-    
-    # Get current movie data
-    movie = db.get_movie_dates(imdb_id)
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
-    
-    # Debug logging (can be removed once Smart Fix is working)
-    print(f"🔍 DEBUG: Movie data for {imdb_id}:")
-    print(f"   - released: {repr(movie.get('released'))}")
-    print(f"   - dateadded: {repr(movie.get('dateadded'))}")
-    print(f"   - source: {repr(movie.get('source'))}")
-    
+def _movie_local_options(movie: Dict[str, Any], imdb_id: str, current_dateadded, current_date_str: str) -> List[Dict[str, Any]]:
+    """Build the date options that need no external lookups (current, released, manual)"""
     options = []
     
     # Option 1: Current dateadded (if exists and is different from released)
-    if movie.get('dateadded'):
+    if current_dateadded:
         current_source = movie.get('source', 'Unknown')
-        current_date = movie['dateadded']
+        current_date = current_dateadded
         
         # Determine what type of current date this is
         if 'radarr' in current_source.lower() and 'import' in current_source.lower():
@@ -759,23 +836,20 @@ async def get_movie_date_options(dependencies: dict, imdb_id: str):
                 # Just date: 2018-07-27
                 release_date = f"{released_raw}T00:00:00"
             
-            # Validate the date format
-            from datetime import datetime
-            datetime.fromisoformat(release_date.replace('Z', '+00:00'))
+            # Validate the date format (fromisoformat accepts a trailing Z on 3.11+)
+            datetime.fromisoformat(release_date)
             
             # Only add if it's different from current dateadded
-            current_dateadded = movie.get('dateadded')
-            current_date_str = current_dateadded.strftime('%Y-%m-%d') if current_dateadded else ''
-            if not current_dateadded or not current_date_str.startswith(released_raw[:10]):  # Compare just the date part
+            if _differs(current_date_str, released_raw):  # Compare just the date part
                 options.append({
                     "type": "digital_release", 
                     "label": "Use Actual Release Date",
                     "date": release_date,
                     "source": "digital_release",
-                    "description": f"Use the movie's actual release date: {released_raw[:10]} (instead of download date)"
+                    "description": _OPTION_DESCRIPTIONS["digital_release"](date=released_raw[:10])
                 })
         except Exception as e:
-            print(f"⚠️ Invalid released date format for {imdb_id}: {movie.get('released')} - {e}")
+            logger.warning("Invalid released date format for %s: %s - %s", imdb_id, movie.get('released'), e)
             # Don't add this option if the date is invalid
     
     # Option 3: Manual entry
@@ -784,92 +858,153 @@ async def get_movie_date_options(dependencies: dict, imdb_id: str):
         "label": "Manual Entry", 
         "date": None,
         "source": "manual",
-        "description": "Enter custom date and time"
+        "description": _MANUAL_OPTION_DESCRIPTION
     })
     
+    return options
+
+
+def _movie_option_lookups(dependencies: dict, imdb_id: str, current_date_str: str) -> List[tuple]:
+    """
+    Build the external date lookups for a movie (Radarr, TMDB, OMDb)
+    
+    Returns (name, lookup) pairs for the enabled sources. Each lookup is a
+    blocking call that returns an option dict or None.
+    """
+    # Get movie processor and clients from dependencies
+    movie_processor = dependencies.get("movie_processor")
+    if not movie_processor or not hasattr(movie_processor, 'external_clients'):
+        return []
+    external_clients = movie_processor.external_clients
+    
+    def fetch_radarr_import_date():
+        radarr_movie = movie_processor.radarr.movie_by_imdb(imdb_id)
+        movie_id = radarr_movie.get('id') if radarr_movie else None
+        if not movie_id:
+            return None
+        import_date, source = movie_processor.radarr.get_movie_import_date(movie_id, fallback_to_file_date=True)
+        # Failures come back as (None, reason); return None so they aren't cached
+        return (import_date, source) if import_date else None
+    
+    def radarr_lookup():
+        """Check Radarr for import dates"""
+        import_date, source = cached_call(
+            _ARR_LOOKUP_CACHE, ("radarr_import", imdb_id), fetch_radarr_import_date
+        ) or (None, None)
+        if import_date:
+            # Check if this is different from current date
+            if _differs(current_date_str, import_date):
+                return {
+                    "type": "radarr_import",
+                    "label": f"Radarr Import Date ({source})",
+                    "date": import_date,
+                    "source": f"radarr:{source}",
+                    "description": _OPTION_DESCRIPTIONS["radarr_import"](date=import_date[:10], source=source)
+                }
+        return None
+    
+    def tmdb_lookup():
+        """Check TMDB for digital release dates"""
+        digital_release = cached_call(
+            _EXTERNAL_LOOKUP_CACHE, ("tmdb_digital", imdb_id),
+            external_clients.tmdb.get_digital_release_date, imdb_id
+        )
+        if digital_release:
+            # Check if this is different from current date
+            if _differs(current_date_str, digital_release):
+                return {
+                    "type": "tmdb_digital",
+                    "label": "TMDB Digital Release",
+                    "date": f"{digital_release}T00:00:00",
+                    "source": "tmdb:digital_release",
+                    "description": _OPTION_DESCRIPTIONS["tmdb_digital"](date=digital_release)
+                }
+        return None
+    
+    def omdb_lookup():
+        """Check OMDb for additional release info"""
+        omdb_details = cached_call(
+            _EXTERNAL_LOOKUP_CACHE, ("omdb", imdb_id),
+            external_clients.omdb.get_movie_details, imdb_id
+        )
+        if omdb_details and omdb_details.get('Released') and omdb_details['Released'] != 'N/A':
+            omdb_iso = _parse_omdb_date(omdb_details['Released'])
+            
+            # Check if this is different from current date (skip if date parsing fails)
+            if omdb_iso and _differs(current_date_str, omdb_iso):
+                return {
+                    "type": "omdb_release",
+                    "label": "OMDb Release Date",
+                    "date": f"{omdb_iso}T00:00:00",
+                    "source": "omdb:release",
+                    "description": _OPTION_DESCRIPTIONS["omdb_release"](date=omdb_iso)
+                }
+        return None
+    
+    def tmdb_then_omdb_lookup():
+        """TMDB digital release, falling back to OMDb only when TMDB has nothing"""
+        try:
+            option = tmdb_lookup()
+        except Exception as e:
+            logger.warning("Failed to get TMDB digital release for %s: %s", imdb_id, e, exc_info=True)
+            option = None
+        return option or omdb_lookup()
+    
+    lookups = []
+    if movie_processor.radarr and movie_processor.radarr.enabled:
+        lookups.append(("Radarr import date", radarr_lookup))
+    if external_clients.tmdb.enabled and external_clients.omdb.enabled and not dependencies["config"].omdb_always:
+        lookups.append(("TMDB/OMDb release date", tmdb_then_omdb_lookup))
+    else:
+        if external_clients.tmdb.enabled:
+            lookups.append(("TMDB digital release", tmdb_lookup))
+        if external_clients.omdb.enabled:
+            lookups.append(("OMDb details", omdb_lookup))
+    
+    return lookups
+
+
+def _load_movie_for_options(dependencies: dict, imdb_id: str):
+    """Fetch the movie row and its current date string, or raise 404"""
+    movie = dependencies["db"].get_movie_dates(imdb_id)
+    if not movie:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    
+    logger.debug("Movie data for %s: released=%r dateadded=%r source=%r",
+                 imdb_id, movie.get('released'), movie.get('dateadded'), movie.get('source'))
+    
+    # Compared against every candidate date below
+    current_dateadded = movie.get('dateadded')
+    current_date_str = current_dateadded.strftime('%Y-%m-%d') if current_dateadded else ''
+    return movie, current_dateadded, current_date_str
+
+
+async def get_movie_date_options(dependencies: dict, imdb_id: str):
+    """Get available date options for a movie (Radarr import, digital release, etc.)"""
+    movie, current_dateadded, current_date_str = _load_movie_for_options(dependencies, imdb_id)
+    options = _movie_local_options(movie, imdb_id, current_dateadded, current_date_str)
+    
     # Option 4: Active lookup from external sources
     try:
-        # Get movie processor and clients from dependencies
-        movie_processor = dependencies.get("movie_processor")
-        if movie_processor and hasattr(movie_processor, 'external_clients'):
-            external_clients = movie_processor.external_clients
-            
-            # Check Radarr for import dates
-            if movie_processor.radarr and movie_processor.radarr.enabled:
-                try:
-                    radarr_movie = movie_processor.radarr.movie_by_imdb(imdb_id)
-                    if radarr_movie:
-                        movie_id = radarr_movie.get('id')
-                        if movie_id:
-                            import_date, source = movie_processor.radarr.get_movie_import_date(movie_id, fallback_to_file_date=True)
-                            if import_date and source != "no_valid_date_source":
-                                # Check if this is different from current date
-                                current_dateadded = movie.get('dateadded')
-                                current_date_str = current_dateadded.strftime('%Y-%m-%d') if current_dateadded else ''
-                                if not current_dateadded or not current_date_str.startswith(import_date[:10]):
-                                    options.append({
-                                        "type": "radarr_import",
-                                        "label": f"Radarr Import Date ({source})",
-                                        "date": import_date,
-                                        "source": f"radarr:{source}",
-                                        "description": f"Import date from Radarr: {import_date[:10]} (source: {source})"
-                                    })
-                except Exception as e:
-                    print(f"⚠️ Failed to get Radarr import date for {imdb_id}: {e}")
-            
-            # Check TMDB for digital release dates
-            if external_clients.tmdb.enabled:
-                try:
-                    digital_release = external_clients.tmdb.get_digital_release_date(imdb_id)
-                    if digital_release:
-                        # Check if this is different from current date
-                        current_dateadded = movie.get('dateadded')
-                        current_date_str = current_dateadded.strftime('%Y-%m-%d') if current_dateadded else ''
-                        if not current_dateadded or not current_date_str.startswith(digital_release[:10]):
-                            options.append({
-                                "type": "tmdb_digital",
-                                "label": "TMDB Digital Release",
-                                "date": f"{digital_release}T00:00:00",
-                                "source": "tmdb:digital_release",
-                                "description": f"Digital release date from TMDB: {digital_release}"
-                            })
-                except Exception as e:
-                    print(f"⚠️ Failed to get TMDB digital release for {imdb_id}: {e}")
-                    
-            # Check OMDb for additional release info
-            if external_clients.omdb.enabled:
-                try:
-                    omdb_details = external_clients.omdb.get_movie_details(imdb_id)
-                    if omdb_details and omdb_details.get('Released') and omdb_details['Released'] != 'N/A':
-                        from datetime import datetime
-                        try:
-                            # Parse OMDb date format (e.g., "27 Jul 2018")
-                            omdb_date = datetime.strptime(omdb_details['Released'], '%d %b %Y')
-                            omdb_iso = omdb_date.strftime('%Y-%m-%d')
-                            
-                            # Check if this is different from current date
-                            current_dateadded = movie.get('dateadded')
-                            current_date_str = current_dateadded.strftime('%Y-%m-%d') if current_dateadded else ''
-                            if not current_dateadded or not current_date_str.startswith(omdb_iso):
-                                options.append({
-                                    "type": "omdb_release",
-                                    "label": "OMDb Release Date",
-                                    "date": f"{omdb_iso}T00:00:00",
-                                    "source": "omdb:release",
-                                    "description": f"Release date from OMDb: {omdb_iso}"
-                                })
-                        except ValueError:
-                            # Skip if date parsing fails
-                            pass
-                except Exception as e:
-                    print(f"⚠️ Failed to get OMDb details for {imdb_id}: {e}")
-                    
+        lookups = _movie_option_lookups(dependencies, imdb_id, current_date_str)
+        
+        # The clients are blocking, so run them side by side in the executor
+        loop = asyncio.get_event_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, lookup) for _, lookup in lookups),
+            return_exceptions=True
+        )
+        
+        for (name, _), result in zip(lookups, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to get %s for %s: %s", name, imdb_id, result, exc_info=result)
+            elif result:
+                options.append(result)
+                
     except Exception as e:
-        print(f"⚠️ External source lookup failed for {imdb_id}: {e}")
+        logger.warning("External source lookup failed for %s: %s", imdb_id, e)
     
-    print(f"🔍 DEBUG: Generated {len(options)} options for {imdb_id}:")
-    for i, option in enumerate(options):
-        print(f"   Option {i}: {option}")
+    logger.debug("Generated %d options for %s: %s", len(options), imdb_id, options)
     
     return {
         "imdb_id": imdb_id,
@@ -878,320 +1013,353 @@ async def get_movie_date_options(dependencies: dict, imdb_id: str):
     }
 
 
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+async def stream_movie_date_options(dependencies: dict, imdb_id: str) -> StreamingResponse:
+    """
+    Stream date options for a movie as Server-Sent Events
+    
+    Sends a ``current`` event with the movie row, one ``option`` event for
+    each local option straight away and for each external option as soon
+    as its source answers, then a final ``done`` event. The page can show
+    the local options without waiting for the slowest external source.
+    """
+    movie, current_dateadded, current_date_str = _load_movie_for_options(dependencies, imdb_id)
+    
+    async def generate():
+        yield _sse_event("current", {"imdb_id": imdb_id, "current_data": movie})
+        
+        for option in _movie_local_options(movie, imdb_id, current_dateadded, current_date_str):
+            yield _sse_event("option", option)
+        
+        try:
+            lookups = _movie_option_lookups(dependencies, imdb_id, current_date_str)
+        except Exception as e:
+            logger.warning("External source lookup failed for %s: %s", imdb_id, e)
+            lookups = []
+        
+        loop = asyncio.get_event_loop()
+        
+        async def run_lookup(name, lookup):
+            try:
+                return await loop.run_in_executor(None, lookup)
+            except Exception as e:
+                logger.warning("Failed to get %s for %s: %s", name, imdb_id, e, exc_info=e)
+                return None
+        
+        # Emit each external option as soon as its source answers
+        for next_option in asyncio.as_completed([run_lookup(name, lookup) for name, lookup in lookups]):
+            option = await next_option
+            if option:
+                yield _sse_event("option", option)
+        
+        yield _sse_event("done", {"imdb_id": imdb_id})
+    
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 async def get_episode_date_options(dependencies: dict, imdb_id: str, season: int, episode: int):
     """Get available date options for an episode"""
-    print(f"🔍 DEBUG: get_episode_date_options called with imdb_id={imdb_id}, season={season}, episode={episode}")
+    logger.debug("get_episode_date_options called with imdb_id=%s, season=%s, episode=%s", imdb_id, season, episode)
     db = dependencies["db"]
     
     # Validate parameters with enhanced checking
     try:
         if not imdb_id or not imdb_id.strip():
-            print(f"❌ Invalid imdb_id: '{imdb_id}'")
+            logger.debug("Invalid imdb_id: %r", imdb_id)
             raise HTTPException(status_code=422, detail="Invalid imdb_id parameter")
         
         # Convert and validate season
         season = int(season) if isinstance(season, str) else season
         if season < 0:
-            print(f"❌ Invalid season: {season}")
+            logger.debug("Invalid season: %s", season)
             raise HTTPException(status_code=422, detail="Season must be >= 0")
             
         # Convert and validate episode  
         episode = int(episode) if isinstance(episode, str) else episode
         if episode < 1:
-            print(f"❌ Invalid episode: {episode}")
+            logger.debug("Invalid episode: %s", episode)
             raise HTTPException(status_code=422, detail="Episode must be >= 1")
     except ValueError as e:
-        print(f"❌ Parameter conversion error: {e}")
+        logger.debug("Parameter conversion error: %s", e)
         raise HTTPException(status_code=422, detail=f"Invalid parameter types: {e}")
     
     # Get current episode data
     episode_data = db.get_episode_date(imdb_id, season, episode)
-    print(f"🔍 DEBUG: Episode data from DB: {episode_data}")
+    logger.debug("Episode data from DB: %s", episode_data)
     if not episode_data:
-        print(f"❌ Episode not found in database: {imdb_id} S{season:02d}E{episode:02d}")
+        logger.debug("Episode not found in database: %s S%02dE%02d", imdb_id, season, episode)
         raise HTTPException(status_code=404, detail="Episode not found")
     
+    # Compared against every candidate date below
+    current_dateadded = episode_data.get('dateadded')
+    current_date_str = current_dateadded.strftime('%Y-%m-%d') if current_dateadded else ''
+    current_aired = str(episode_data['aired']) if episode_data.get('aired') else ''
+    
     options = []
     
     # Option 1: Current dateadded (if exists)
-    if episode_data.get('dateadded'):
+    if current_dateadded:
         options.append({
             "type": "current",
             "label": f"Keep Current ({episode_data.get('source', 'Unknown')})",
-            "date": episode_data['dateadded'],
+            "date": current_dateadded,
             "source": episode_data.get('source', 'manual'),
-            "description": f"Currently using: {episode_data.get('source', 'Unknown')}"
+            "description": _OPTION_DESCRIPTIONS["episode_current"](source=episode_data.get('source', 'Unknown'))
         })
     
     # Option 2: Aired date (if exists in database)
-    if episode_data.get('aired'):
+    if current_aired:
         options.append({
             "type": "airdate",
             "label": "Use Air Date",
-            "date": f"{episode_data['aired']}T20:00:00",  # Default to 8 PM
+            "date": f"{current_aired}T20:00:00",  # Default to 8 PM
             "source": "airdate",
-            "description": f"Use original air date: {episode_data['aired']}"
+            "description": _OPTION_DESCRIPTIONS["airdate"](date=current_aired)
         })
     
     # Option 3: Active lookup from external sources
     try:
         # Get TV processor and clients from dependencies
         tv_processor = dependencies.get("tv_processor")
-        print(f"🔍 DEBUG: tv_processor available: {tv_processor is not None}")
-        if tv_processor:
-            print(f"🔍 DEBUG: tv_processor has external_clients: {hasattr(tv_processor, 'external_clients')}")
-            print(f"🔍 DEBUG: tv_processor has sonarr: {hasattr(tv_processor, 'sonarr')}")
-        
         if tv_processor and hasattr(tv_processor, 'external_clients'):
             external_clients = tv_processor.external_clients
-            print(f"🔍 DEBUG: external_clients available: {external_clients is not None}")
-            if external_clients:
-                print(f"🔍 DEBUG: TMDB enabled: {external_clients.tmdb.enabled if hasattr(external_clients, 'tmdb') else 'No TMDB client'}")
             
-            # Check Sonarr for import dates
-            if tv_processor.sonarr and tv_processor.sonarr.enabled:
-                try:
-                    print(f"🔍 DEBUG: Attempting Sonarr lookup for {imdb_id}")
-                    # Look up the series and episode in Sonarr
-                    series_data = tv_processor.sonarr.series_by_imdb(imdb_id)
+            def sonarr_lookup():
+                """Check Sonarr for import dates"""
+                found = []
+                logger.debug("Attempting Sonarr lookup for %s", imdb_id)
+                # Look up the series and episode in Sonarr
+                series_data = tv_processor.sonarr.series_by_imdb(imdb_id)
+                
+                # If IMDb lookup fails, try direct series lookup as fallback
+                if not series_data:
+                    logger.debug("IMDb lookup failed, trying direct series lookup")
+                    try:
+                        # Try direct lookup against the cached IMDb -> series index
+                        series_data = tv_processor.sonarr.series_by_imdb_direct(imdb_id)
+                        
+                        # If still no match, accept a series whose IMDb number is very close
+                        if not series_data:
+                            logger.debug("Trying fuzzy match for IMDb number: %s", imdb_id)
+                            nearest = tv_processor.sonarr.series_by_nearest_imdb(imdb_id)
+                            if nearest:
+                                series_data, diff = nearest
+                                logger.debug("Found close IMDb match: %s vs %s (diff: %d)", series_data.get('imdbId'), imdb_id, diff)
+                    except Exception as e:
+                        logger.exception("Direct series lookup also failed: %s", e)
+                
+                logger.debug("Series data found: %s", series_data is not None)
+                if series_data:
+                    series_id = series_data.get('id')
+                    series_title = series_data.get('title', 'Unknown')
+                    logger.debug("Found series %r with ID %s", series_title, series_id)
                     
-                    # If IMDb lookup fails, try direct series lookup as fallback
-                    if not series_data:
-                        print(f"🔍 DEBUG: IMDb lookup failed, trying direct series lookup")
-                        try:
-                            # Let's also debug what series are available
-                            all_series = tv_processor.sonarr.get_all_series()
-                            print(f"🔍 DEBUG: Found {len(all_series)} total series in Sonarr")
-                            
-                            # Look for Lincoln Lawyer specifically
-                            lincoln_series = [s for s in all_series if 'lincoln' in s.get('title', '').lower()]
-                            print(f"🔍 DEBUG: Lincoln Lawyer series found: {len(lincoln_series)}")
-                            for ls in lincoln_series:
-                                print(f"   - Title: '{ls.get('title')}', IMDb: '{ls.get('imdbId')}', ID: {ls.get('id')}")
-                            
-                            # Try direct lookup first
-                            series_data = tv_processor.sonarr.series_by_imdb_direct(imdb_id)
+                    if series_id:
+                        # Fetch just this episode (the client caches the season listing)
+                        logger.debug("Getting S%02dE%02d for series %s", season, episode, series_id)
+                        ep = tv_processor.sonarr.episode_by_number(series_id, season, episode)
+                        
+                        if ep:
+                            episode_id = ep.get('id')
+                            ep_title = ep.get('title', 'Unknown')
+                            ep_air_date = ep.get('airDate')  # Get air date from Sonarr
+                            logger.debug("Found target episode %r with ID %s, airDate: %s", ep_title, episode_id, ep_air_date)
                             
-                            # If still no match but we found Lincoln Lawyer series, try fuzzy matching
-                            if not series_data and lincoln_series:
-                                target_imdb_num = imdb_id.replace('tt', '').lower()
-                                print(f"🔍 DEBUG: Trying fuzzy match for IMDb number: {target_imdb_num}")
+                            if episode_id:
+                                # Get import history for this specific episode
+                                logger.debug("Getting import history for episode %s", episode_id)
+                                import_date = cached_call(
+                                    _ARR_LOOKUP_CACHE, ("sonarr_import", imdb_id, season, episode),
+                                    tv_processor.sonarr.get_episode_import_history, episode_id
+                                )
+                                logger.debug("Import date found: %s", import_date)
                                 
-                                for ls in lincoln_series:
-                                    ls_imdb = ls.get('imdbId', '')
-                                    ls_imdb_num = ls_imdb.replace('tt', '').lower()
-                                    print(f"   - Comparing {target_imdb_num} vs {ls_imdb_num}")
-                                    
-                                    # Check if IMDb numbers are close (within 10 digits)
-                                    if ls_imdb_num and target_imdb_num:
-                                        try:
-                                            target_num = int(target_imdb_num)
-                                            ls_num = int(ls_imdb_num)
-                                            diff = abs(target_num - ls_num)
-                                            print(f"   - Numeric difference: {diff}")
-                                            
-                                            if diff <= 10:  # Allow small IMDb ID differences
-                                                print(f"✅ Found close IMDb match: {ls_imdb} vs {imdb_id} (diff: {diff})")
-                                                series_data = ls
-                                                break
-                                        except ValueError:
-                                            continue
-                        except Exception as e:
-                            print(f"⚠️ Direct series lookup also failed: {e}")
-                            import traceback
-                            print(f"   Traceback: {traceback.format_exc()}")
-                    
-                    print(f"🔍 DEBUG: Series data found: {series_data is not None}")
-                    if series_data:
-                        series_id = series_data.get('id')
-                        series_title = series_data.get('title', 'Unknown')
-                        print(f"🔍 DEBUG: Found series '{series_title}' with ID {series_id}")
-                        
-                        if series_id:
-                            # Get episodes for the series
-                            print(f"🔍 DEBUG: Getting episodes for series {series_id}")
-                            episodes = tv_processor.sonarr.episodes_for_series(series_id)
-                            print(f"🔍 DEBUG: Found {len(episodes)} episodes")
+                                if import_date:
+                                    # Check if this is different from current date
+                                    if _differs(current_date_str, import_date):
+                                        found.append({
+                                            "type": "sonarr_import",
+                                            "label": "Sonarr Import Date",
+                                            "date": import_date,
+                                            "source": "sonarr:import_history",
+                                            "description": _OPTION_DESCRIPTIONS["sonarr_import"](date=import_date[:10])
+                                        })
+                                        logger.debug("Added Sonarr import option: %s", import_date[:10])
                             
-                            for ep in episodes:
-                                ep_season = ep.get('seasonNumber')
-                                ep_episode = ep.get('episodeNumber')
-                                # Convert to int for proper comparison (handle both string and int from Sonarr)
-                                try:
-                                    ep_season = int(ep_season) if ep_season is not None else None
-                                    ep_episode = int(ep_episode) if ep_episode is not None else None
-                                except (ValueError, TypeError):
-                                    continue  # Skip episodes with invalid season/episode numbers
+                                # If no import date but we have air date from Sonarr, add as air date option
+                                if not import_date and ep_air_date:
+                                    # Add air date option if different from current or missing
+                                    if _differs(current_aired, ep_air_date):
+                                        found.append({
+                                            "type": "sonarr_air",
+                                            "label": "Sonarr Air Date",
+                                            "date": f"{ep_air_date}T20:00:00",
+                                            "source": "sonarr:airdate",
+                                            "description": _OPTION_DESCRIPTIONS["sonarr_air"](date=ep_air_date)
+                                        })
+                                        logger.debug("Added Sonarr air date option: %s", ep_air_date)
                                     
-                                if ep_season == season and ep_episode == episode:
-                                    episode_id = ep.get('id')
-                                    ep_title = ep.get('title', 'Unknown')
-                                    ep_air_date = ep.get('airDate')  # Get air date from Sonarr
-                                    print(f"🔍 DEBUG: Found target episode '{ep_title}' with ID {episode_id}, airDate: {ep_air_date}")
-                                    
-                                    if episode_id:
-                                        # Get import history for this specific episode
-                                        print(f"🔍 DEBUG: Getting import history for episode {episode_id}")
-                                        import_date = tv_processor.sonarr.get_episode_import_history(episode_id)
-                                        print(f"🔍 DEBUG: Import date found: {import_date}")
-                                        
-                                        if import_date:
-                                            # Check if this is different from current date
-                                            current_dateadded = episode_data.get('dateadded')
-                                            current_date_str = current_dateadded.strftime('%Y-%m-%d') if current_dateadded else ''
-                                            if not current_dateadded or not current_date_str.startswith(import_date[:10]):
-                                                options.append({
-                                                    "type": "sonarr_import",
-                                                    "label": "Sonarr Import Date",
-                                                    "date": import_date,
-                                                    "source": "sonarr:import_history",
-                                                    "description": f"Import date from Sonarr: {import_date[:10]}"
-                                                })
-                                                print(f"✅ Added Sonarr import option: {import_date[:10]}")
-                                    
-                                        # If no import date but we have air date from Sonarr, add as air date option
-                                        if not import_date and ep_air_date:
-                                            current_aired = episode_data.get('aired', '')
-                                            current_dateadded = episode_data.get('dateadded', '')
-                                            
-                                            # Add air date option if different from current or missing
-                                            if not current_aired or current_aired != ep_air_date:
-                                                options.append({
-                                                    "type": "sonarr_air",
-                                                    "label": "Sonarr Air Date",
-                                                    "date": f"{ep_air_date}T20:00:00",
-                                                    "source": "sonarr:airdate",
-                                                    "description": f"Air date from Sonarr: {ep_air_date}"
-                                                })
-                                                print(f"✅ Added Sonarr air date option: {ep_air_date}")
-                                            
-                                            # If no dateadded, suggest using air date as import date fallback
-                                            if not current_dateadded:
-                                                options.append({
-                                                    "type": "sonarr_air_fallback",
-                                                    "label": "Use Air Date as Import Date",
-                                                    "date": f"{ep_air_date}T20:00:00",
-                                                    "source": "sonarr:aired_fallback",
-                                                    "description": f"Use Sonarr air date as import date: {ep_air_date}"
-                                                })
-                                                print(f"✅ Added Sonarr air date fallback option: {ep_air_date}")
-                                    
-                                    break
-                    else:
-                        print(f"❌ No series found in Sonarr for {imdb_id}")
-                except Exception as e:
-                    print(f"⚠️ Failed to get Sonarr import date for {imdb_id} S{season:02d}E{episode:02d}: {e}")
-                    import traceback
-                    print(f"   Traceback: {traceback.format_exc()}")
+                                    # If no dateadded, suggest using air date as import date fallback
+                                    if not current_dateadded:
+                                        found.append({
+                                            "type": "sonarr_air_fallback",
+                                            "label": "Use Air Date as Import Date",
+                                            "date": f"{ep_air_date}T20:00:00",
+                                            "source": "sonarr:aired_fallback",
+                                            "description": _OPTION_DESCRIPTIONS["sonarr_air_fallback"](date=ep_air_date)
+                                        })
+                                        logger.debug("Added Sonarr air date fallback option: %s", ep_air_date)
+                else:
+                    logger.debug("No series found in Sonarr for %s", imdb_id)
+                return found
             
-            # Check TMDB for episode air dates
-            if external_clients.tmdb.enabled:
-                try:
-                    print(f"🔍 DEBUG: Attempting TMDB lookup for {imdb_id}")
-                    # Get TMDB TV series ID from IMDb ID using find endpoint
-                    tv_find_result = external_clients.tmdb._get(f"/find/{imdb_id}", {"external_source": "imdb_id"})
-                    print(f"🔍 DEBUG: TMDB find result: {tv_find_result is not None}")
-                    print(f"🔍 DEBUG: TMDB raw response: {tv_find_result}")
+            def tmdb_lookup():
+                """Check TMDB for episode air dates"""
+                logger.debug("Attempting TMDB lookup for %s", imdb_id)
+                # Get TMDB TV series ID from IMDb ID using find endpoint
+                tv_find_result = cached_call(
+                    _EXTERNAL_LOOKUP_CACHE, ("tmdb_find", imdb_id),
+                    external_clients.tmdb._get, f"/find/{imdb_id}", {"external_source": "imdb_id"}
+                )
+                logger.debug("TMDB find result: %s", tv_find_result is not None)
+                logger.debug("TMDB raw response: %s", tv_find_result)
+                
+                # Check both tv_results and tv_episode_results
+                tmdb_id = None
+                tv_title = "Unknown"
+                
+                if tv_find_result and tv_find_result.get("tv_results"):
+                    tv_results = tv_find_result.get("tv_results", [])
+                    logger.debug("Found %d TV results", len(tv_results))
                     
-                    # Check both tv_results and tv_episode_results
-                    tmdb_id = None
-                    tv_title = "Unknown"
+                    if tv_results:
+                        tv_show = tv_results[0]
+                        tmdb_id = tv_show.get("id")
+                        tv_title = tv_show.get("name", "Unknown")
+                        logger.debug("Found TMDB series %r with ID %s", tv_title, tmdb_id)
+                
+                # Fallback: Check tv_episode_results for show_id
+                elif tv_find_result and tv_find_result.get("tv_episode_results"):
+                    episode_results = tv_find_result.get("tv_episode_results", [])
+                    logger.debug("Found %d TV episode results", len(episode_results))
                     
-                    if tv_find_result and tv_find_result.get("tv_results"):
-                        tv_results = tv_find_result.get("tv_results", [])
-                        print(f"🔍 DEBUG: Found {len(tv_results)} TV results")
-                        
-                        if tv_results:
-                            tv_show = tv_results[0]
-                            tmdb_id = tv_show.get("id")
-                            tv_title = tv_show.get("name", "Unknown")
-                            print(f"🔍 DEBUG: Found TMDB series '{tv_title}' with ID {tmdb_id}")
+                    if episode_results:
+                        tmdb_episode_data = episode_results[0]
+                        tmdb_id = tmdb_episode_data.get("show_id")
+                        episode_name = tmdb_episode_data.get("name", "Unknown")
+                        logger.debug("Found TMDB series via episode %r with show_id %s", episode_name, tmdb_id)
+                
+                if tmdb_id:
+                    logger.debug("Using TMDB ID %s for series lookup", tmdb_id)
                     
-                    # Fallback: Check tv_episode_results for show_id
-                    elif tv_find_result and tv_find_result.get("tv_episode_results"):
-                        episode_results = tv_find_result.get("tv_episode_results", [])
-                        print(f"🔍 DEBUG: Found {len(episode_results)} TV episode results")
-                        
-                        if episode_results:
-                            tmdb_episode_data = episode_results[0]
-                            tmdb_id = tmdb_episode_data.get("show_id")
-                            episode_name = tmdb_episode_data.get("name", "Unknown")
-                            print(f"🔍 DEBUG: Found TMDB series via episode '{episode_name}' with show_id {tmdb_id}")
+                    # Get episode air date from TMDB
+                    logger.debug("Getting TMDB season %s episodes for series %s", season, tmdb_id)
+                    episodes = cached_call(
+                        _EXTERNAL_LOOKUP_CACHE, ("tmdb_season", tmdb_id, season),
+                        external_clients.tmdb.get_tv_season_episodes, tmdb_id, season
+                    ) or {}
+                    logger.debug("TMDB episodes found: %s", episodes)
                     
-                    if tmdb_id:
-                        print(f"🔍 DEBUG: Using TMDB ID {tmdb_id} for series lookup")
-                        
-                        # Get episode air date from TMDB
-                        print(f"🔍 DEBUG: Getting TMDB season {season} episodes for series {tmdb_id}")
-                        episodes = external_clients.tmdb.get_tv_season_episodes(tmdb_id, season)
-                        print(f"🔍 DEBUG: TMDB episodes found: {episodes}")
-                        
-                        if episode in episodes:
-                            air_date = episodes[episode]
-                            print(f"🔍 DEBUG: TMDB air date for S{season:02d}E{episode:02d}: {air_date}")
-                            
-                            if air_date:
-                                # Check if this is different from current aired date
-                                current_aired = episode_data.get('aired', '')
-                                if not current_aired or current_aired != air_date:
-                                    options.append({
-                                        "type": "tmdb_air",
-                                        "label": "TMDB Air Date",
-                                        "date": f"{air_date}T20:00:00",  # Default to 8 PM
-                                        "source": "tmdb:airdate",
-                                        "description": f"Air date from TMDB: {air_date}"
-                                    })
-                                    print(f"✅ Added TMDB air date option: {air_date}")
-                                
-                                # If no aired date in database, also add this as "Use Air Date" option
-                                if not current_aired:
-                                    options.insert(1, {  # Insert after current option
-                                        "type": "airdate_tmdb",
-                                        "label": "Use Air Date (TMDB)",
-                                        "date": f"{air_date}T20:00:00",
-                                        "source": "airdate",
-                                        "description": f"Use air date from TMDB: {air_date}"
-                                    })
-                                    print(f"✅ Added 'Use Air Date' option from TMDB: {air_date}")
-                        else:
-                            print(f"❌ Episode {episode} not found in TMDB season {season} data")
-                    else:
-                        print(f"❌ No TV series ID found in TMDB for {imdb_id}")
-                except Exception as e:
-                    print(f"⚠️ Failed to get TMDB air date for {imdb_id} S{season:02d}E{episode:02d}: {e}")
-                    import traceback
-                    print(f"   Traceback: {traceback.format_exc()}")
+                    if episode in episodes:
+                        air_date = episodes[episode]
+                        logger.debug("TMDB air date for S%02dE%02d: %s", season, episode, air_date)
+                        return air_date
+                    logger.debug("Episode %s not found in TMDB season %s data", episode, season)
+                else:
+                    logger.debug("No TV series ID found in TMDB for %s", imdb_id)
+                return None
             
-            # Check external clients for episode air dates (TVDB, OMDb)
+            def external_lookup():
+                """Check external clients for episode air dates (TVDB, OMDb)"""
+                return cached_call(
+                    _EXTERNAL_LOOKUP_CACHE, ("external_air", imdb_id, season, episode),
+                    external_clients.get_episode_air_date, imdb_id, season, episode
+                )
+            
+            lookups = []
+            if tv_processor.sonarr and tv_processor.sonarr.enabled:
+                lookups.append(("sonarr", "Sonarr import date", sonarr_lookup))
+            if external_clients.tmdb.enabled:
+                lookups.append(("tmdb", "TMDB air date", tmdb_lookup))
             if hasattr(external_clients, 'get_episode_air_date'):
-                try:
-                    air_date = external_clients.get_episode_air_date(imdb_id, season, episode)
-                    if air_date:
-                        # Check if this is different from current aired date
-                        current_aired = episode_data.get('aired', '')
-                        if not current_aired or current_aired != air_date:
-                            options.append({
-                                "type": "external_air",
-                                "label": "External Air Date",
-                                "date": f"{air_date}T20:00:00",  # Default to 8 PM
-                                "source": "external:airdate",
-                                "description": f"Air date from external sources: {air_date}"
-                            })
-                        
-                        # If no aired date in database and not already added from TMDB, add this as "Use Air Date" option
-                        if not current_aired and not any(opt.get('type') == 'airdate_tmdb' for opt in options):
-                            options.insert(1, {  # Insert after current option
-                                "type": "airdate_external",
-                                "label": "Use Air Date (External)",
-                                "date": f"{air_date}T20:00:00",
-                                "source": "airdate",
-                                "description": f"Use air date from external sources: {air_date}"
-                            })
-                except Exception as e:
-                    print(f"⚠️ Failed to get external air date for {imdb_id} S{season:02d}E{episode:02d}: {e}")
+                lookups.append(("external", "external air date", external_lookup))
+            
+            # The clients are blocking, so run them side by side in the executor
+            loop = asyncio.get_event_loop()
+            gathered = await asyncio.gather(
+                *(loop.run_in_executor(None, lookup) for _, _, lookup in lookups),
+                return_exceptions=True
+            )
+            
+            results = {}
+            for (key, name, _), result in zip(lookups, gathered):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to get %s for %s S%02dE%02d: %s", name, imdb_id, season, episode, result,
+                                   exc_info=result)
+                else:
+                    results[key] = result
+            
+            # Merge in the same order the sources used to be queried
+            options.extend(results.get("sonarr") or [])
+            
+            added_airdate_tmdb = False
+            air_date = results.get("tmdb")
+            if air_date:
+                # Check if this is different from current aired date
+                if _differs(current_aired, air_date):
+                    options.append({
+                        "type": "tmdb_air",
+                        "label": "TMDB Air Date",
+                        "date": f"{air_date}T20:00:00",  # Default to 8 PM
+                        "source": "tmdb:airdate",
+                        "description": _OPTION_DESCRIPTIONS["tmdb_air"](date=air_date)
+                    })
+                    logger.debug("Added TMDB air date option: %s", air_date)
+                
+                # If no aired date in database, also add this as "Use Air Date" option
+                if not current_aired:
+                    options.insert(1, {  # Insert after current option
+                        "type": "airdate_tmdb",
+                        "label": "Use Air Date (TMDB)",
+                        "date": f"{air_date}T20:00:00",
+                        "source": "airdate",
+                        "description": _OPTION_DESCRIPTIONS["airdate_tmdb"](date=air_date)
+                    })
+                    added_airdate_tmdb = True
+                    logger.debug("Added 'Use Air Date' option from TMDB: %s", air_date)
+            
+            air_date = results.get("external")
+            if air_date:
+                # Check if this is different from current aired date
+                if _differs(current_aired, air_date):
+                    options.append({
+                        "type": "external_air",
+                        "label": "External Air Date",
+                        "date": f"{air_date}T20:00:00",  # Default to 8 PM
+                        "source": "external:airdate",
+                        "description": _OPTION_DESCRIPTIONS["external_air"](date=air_date)
+                    })
+                
+                # If no aired date in database and not already added from TMDB, add this as "Use Air Date" option
+                if not current_aired and not added_airdate_tmdb:
+                    options.insert(1, {  # Insert after current option
+                        "type": "airdate_external",
+                        "label": "Use Air Date (External)",
+                        "date": f"{air_date}T20:00:00",
+                        "source": "airdate",
+                        "description": _OPTION_DESCRIPTIONS["airdate_external"](date=air_date)
+                    })
                     
     except Exception as e:
-        print(f"⚠️ External source lookup failed for {imdb_id} S{season:02d}E{episode:02d}: {e}")
+        logger.warning("External source lookup failed for %s S%02dE%02d: %s", imdb_id, season, episode, e)
     
     # Option 4: Manual entry
     options.append({
@@ -1199,14 +1367,14 @@ async def get_episode_date_options(dependencies: dict, imdb_id: str, season: int
         "label": "Manual Entry",
         "date": None,
         "source": "manual", 
-        "description": "Enter custom date and time"
+        "description": _MANUAL_OPTION_DESCRIPTION
     })
     
-    print(f"🔍 DEBUG: Generated {len(options)} options for {imdb_id} S{season:02d}E{episode:02d}:")
-    for i, option in enumerate(options):
-        print(f"   Option {i}: {option}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Generated %d options for %s S%02dE%02d:", len(options), imdb_id, season, episode)
+        for i, option in enumerate(options):
+            logger.debug("   Option %d: %s", i, option)
     
-    print(f"🔍 DEBUG: Returning result with {len(options)} options")
     return {
         "imdb_id": imdb_id,
         "season": season,
@@ -1216,44 +1384,118 @@ async def get_episode_date_options(dependencies: dict, imdb_id: str, season: int
     }
 
 
+# Static replies for write endpoints that only the core container serves,
+# serialized once at import
+_UPDATES_UNAVAILABLE = orjson.dumps(
+    {"error": "Updates not available in web container. Use core container on port 8085."})
+_DATE_OPTIONS_UNAVAILABLE = orjson.dumps(
+    {"options": [], "message": "Date options not available in web container. Use core container on port 8085."})
+_BULK_UNAVAILABLE = orjson.dumps(
+    {"error": "Bulk operations not available in web container. Use core container on port 8085."})
+
+
+class _CircuitBreaker:
+    """
+    Fail fast after repeated connection failures to a backend
+    
+    After ``threshold`` consecutive failures the breaker opens and callers
+    are turned away for ``cooldown`` seconds. Once that has passed a single
+    probe request is let through; success closes the breaker, another
+    failure keeps it open for a further cooldown.
+    """
+    
+    __slots__ = ("threshold", "cooldown", "failures", "opened_at")
+    
+    def __init__(self, threshold: int = 5, cooldown: float = 10.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+    
+    def allow(self) -> bool:
+        """True if a request may be sent to the backend"""
+        if self.failures < self.threshold:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at >= self.cooldown:
+            # Half-open: let this probe through, hold off others for another cooldown
+            self.opened_at = now
+            return True
+        return False
+    
+    def record_success(self) -> None:
+        self.failures = 0
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+class _ScanTracking:
+    """Last scan start seen by the web container (monotonic seconds)"""
+    
+    __slots__ = ("last_scan_time", "scanning")
+    
+    def __init__(self):
+        self.last_scan_time: Optional[float] = None
+        self.scanning = False
+
+
+def _get_cookie(request: Request, name: str) -> Optional[str]:
+    """Read a single cookie from the raw Cookie header without parsing the rest"""
+    header = request.headers.get("cookie")
+    if not header:
+        return None
+    prefix = f"{name}="
+    for part in header.split(";"):
+        part = part.strip()
+        if part.startswith(prefix):
+            return part[len(prefix):]
+    return None
+
+
+def _web_container_stub(body: bytes):
+    """Build an endpoint that always returns the given pre-serialized JSON body"""
+    async def endpoint():
+        return Response(content=body, media_type="application/json")
+    return endpoint
+
+
 def register_web_routes(app, dependencies):
     """Register all web API routes with FastAPI app"""
-    from fastapi import Request, Response
     
     # Dashboard and stats endpoints  
-    @app.get("/api/dashboard")
+    @app.get("/api/dashboard", response_class=ORJSONResponse)
     async def api_dashboard():
         return await get_dashboard_stats(dependencies)
     
-    @app.get("/api/dashboard/stats")
+    @app.get("/api/dashboard/stats", response_class=ORJSONResponse)
     async def api_dashboard_stats():
         return await get_dashboard_stats(dependencies)
     
     # Movies endpoints
-    @app.get("/api/movies")
+    @app.get("/api/movies", response_class=ORJSONResponse)
     async def api_movies_list(skip: int = 0, limit: int = 100, has_date: bool = None, 
                              source_filter: str = None, search: str = None, imdb_search: str = None):
         return await get_movies_list(dependencies, skip, limit, has_date, source_filter, search, imdb_search)
     
-    @app.post("/api/movies/{imdb_id}/update-date")
-    async def api_update_movie_date(imdb_id: str, dateadded: str = None, source: str = "manual"):
-        return {"error": "Updates not available in web container. Use core container on port 8085."}
-    
-    @app.put("/api/movies/{imdb_id}")
-    async def api_update_movie(imdb_id: str, dateadded: str = None, source: str = "manual"):
-        return {"error": "Updates not available in web container. Use core container on port 8085."}
-    
-    @app.get("/api/movies/{imdb_id}/date-options")
-    async def api_movie_date_options(imdb_id: str):
-        return {"options": [], "message": "Date options not available in web container. Use core container on port 8085."}
+    app.add_api_route("/api/movies/{imdb_id}/update-date", _web_container_stub(_UPDATES_UNAVAILABLE),
+                      methods=["POST"], name="api_update_movie_date")
+    app.add_api_route("/api/movies/{imdb_id}", _web_container_stub(_UPDATES_UNAVAILABLE),
+                      methods=["PUT"], name="api_update_movie")
+    app.add_api_route("/api/movies/{imdb_id}/date-options", _web_container_stub(_DATE_OPTIONS_UNAVAILABLE),
+                      methods=["GET"], name="api_movie_date_options")
+    app.add_api_route("/api/movies/{imdb_id}/date-options/stream", _web_container_stub(_DATE_OPTIONS_UNAVAILABLE),
+                      methods=["GET"], name="api_movie_date_options_stream")
     
     # TV series endpoints
-    @app.get("/api/series")
+    @app.get("/api/series", response_class=ORJSONResponse)
     async def api_series_list(skip: int = 0, limit: int = 50, search: str = None, 
                              imdb_search: str = None, date_filter: str = None, source_filter: str = None):
         return await get_tv_series_list(dependencies, skip, limit, search, imdb_search, date_filter, source_filter)
     
-    @app.get("/api/series/{imdb_id}/episodes")
+    @app.get("/api/series/{imdb_id}/episodes", response_class=ORJSONResponse)
     async def api_series_episodes(imdb_id: str):
         return await get_series_episodes(dependencies, imdb_id)
     
@@ -1266,30 +1508,29 @@ def register_web_routes(app, dependencies):
         return await debug_series_date_distribution(dependencies)
     
     # Episode endpoints
-    @app.post("/api/episodes/{imdb_id}/{season}/{episode}/update-date")
-    async def api_update_episode_date(imdb_id: str, season: int, episode: int, 
-                                     dateadded: str = None, source: str = "manual"):
-        return {"error": "Updates not available in web container. Use core container on port 8085."}
-    
-    @app.put("/api/episodes/{imdb_id}/{season}/{episode}")
-    async def api_update_episode(imdb_id: str, season: int, episode: int, 
-                                dateadded: str = None, source: str = "manual"):
-        return {"error": "Updates not available in web container. Use core container on port 8085."}
-    
-    @app.get("/api/episodes/{imdb_id}/{season}/{episode}/date-options")
-    async def api_episode_date_options(imdb_id: str, season: int, episode: int):
-        return {"options": [], "message": "Date options not available in web container. Use core container on port 8085."}
+    app.add_api_route("/api/episodes/{imdb_id}/{season}/{episode}/update-date",
+                      _web_container_stub(_UPDATES_UNAVAILABLE),
+                      methods=["POST"], name="api_update_episode_date")
+    app.add_api_route("/api/episodes/{imdb_id}/{season}/{episode}",
+                      _web_container_stub(_UPDATES_UNAVAILABLE),
+                      methods=["PUT"], name="api_update_episode")
+    app.add_api_route("/api/episodes/{imdb_id}/{season}/{episode}/date-options",
+                      _web_container_stub(_DATE_OPTIONS_UNAVAILABLE),
+                      methods=["GET"], name="api_episode_date_options")
     
     # Bulk operations
-    @app.post("/api/bulk/update-source")
-    async def api_bulk_update_source(media_type: str, old_source: str, new_source: str):
-        return {"error": "Bulk operations not available in web container. Use core container on port 8085."}
+    app.add_api_route("/api/bulk/update-source", _web_container_stub(_BULK_UNAVAILABLE),
+                      methods=["POST"], name="api_bulk_update_source")
     
     # Reports
-    @app.get("/api/reports/missing-dates")
+    @app.get("/api/reports/missing-dates", response_class=ORJSONResponse)
     async def api_missing_dates_report():
         return await get_missing_dates_report(dependencies)
     
+    @app.get("/api/reports/missing-dates/stream")
+    async def api_missing_dates_report_stream():
+        return stream_missing_dates_report(dependencies)
+    
     # Authentication endpoints (for web interface compatibility)
     @app.get("/api/auth/status")
     async def api_auth_status(request: Request):
@@ -1303,107 +1544,169 @@ def register_web_routes(app, dependencies):
         if not session_manager:
             return {"authenticated": False, "auth_enabled": True, "message": "Session manager not available"}
         
-        session_token = request.cookies.get("nfoguard_session")
+        session_token = _get_cookie(request, "nfoguard_session")
         if session_token:
-            username = session_manager.get_session_user(session_token)
+            username = _AUTH_STATUS_CACHE.get(session_token)
+            if username is None:
+                username = session_manager.get_session_user(session_token)
+                if username:
+                    _AUTH_STATUS_CACHE.set(session_token, username)
             if username:
                 return {"authenticated": True, "auth_enabled": True, "username": username}
         
         return {"authenticated": False, "auth_enabled": True, "message": "Not authenticated"}
     
     @app.post("/api/auth/logout")
-    async def api_auth_logout(request: Request, response: Response):
+    async def api_auth_logout(request: Request, response: Response, background_tasks: BackgroundTasks):
         """Logout endpoint - clears session"""
         session_manager = dependencies.get("session_manager")
         if session_manager:
-            session_token = request.cookies.get("nfoguard_session")
+            session_token = _get_cookie(request, "nfoguard_session")
             if session_token:
-                session_manager.delete_session(session_token)
+                _AUTH_STATUS_CACHE.pop(session_token)
+                # The client only needs the cookie cleared; drop the session after responding
+                background_tasks.add_task(session_manager.delete_session, session_token)
         
         response.delete_cookie("nfoguard_session")
         return {"status": "logged_out", "message": "Session cleared"}
     
     # Manual scan endpoints (proxy to core container)
-    @app.post("/manual/scan")
-    async def api_manual_scan(request: Request):
-        """Proxy manual scan requests to core container"""
-        import urllib.request
-        import urllib.parse
-        import urllib.error
-        import json
-        import os
-        import socket
-        
-        # Get core container URL
-        core_host = os.environ.get("CORE_API_HOST", "nfoguard-core")
-        core_port = os.environ.get("CORE_API_PORT", "8080")
-        
-        # Forward query parameters from the request
-        query_string = str(request.url.query) if request.url.query else ""
-        core_url = f"http://{core_host}:{core_port}/manual/scan"
-        if query_string:
-            core_url += f"?{query_string}"
-        
+    core_base_url = (f"http://{os.environ.get('CORE_API_HOST', 'nfoguard-core')}:"
+                     f"{os.environ.get('CORE_API_PORT', '8080')}")
+    # Stop waiting on timeouts while the core container is down
+    core_breaker = _CircuitBreaker(threshold=5, cooldown=10.0)
+    
+    @app.on_event("startup")
+    async def open_core_session():
+        """Open the shared keep-alive session used to proxy requests to the core container"""
+        # Status is polled by the UI, so keep connections alive between polls
+        # and resolve the core hostname at most once a minute; the core API
+        # sets no cookies we need to track. A status request the core can't
+        # answer in 2s means it's unhealthy, so don't wait longer than that.
+        app.state.core_session = aiohttp.ClientSession(
+            base_url=core_base_url,
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30, ttl_dns_cache=60),
+            cookie_jar=aiohttp.DummyCookieJar(),
+            timeout=aiohttp.ClientTimeout(total=2)
+        )
+    
+    @app.on_event("shutdown")
+    async def close_core_session():
+        """Close the core container proxy session"""
+        await app.state.core_session.close()
+    
+    # Identical scan triggers arriving within a short window (double clicks,
+    # several tabs or scripts) share one core request instead of each
+    # starting their own background scan on the core container
+    scan_batch_window = int(os.environ.get("SCAN_BATCH_WINDOW_MS", "20")) / 1000
+    pending_scans: Dict[str, asyncio.Task] = {}
+    
+    async def post_manual_scan(scan_path: str) -> dict:
+        """Send one manual scan request to the core container"""
+        await asyncio.sleep(scan_batch_window)
+        if not core_breaker.allow():
+            raise HTTPException(status_code=503, detail="Core container unavailable (recent connection failures)")
         try:
-            # Create request with timeout (no body needed for query parameters)
-            req = urllib.request.Request(core_url, method='POST')
-            
-            # Make request with timeout
-            with urllib.request.urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                return json.loads(response_data)
+            async with app.state.core_session.post(
+                scan_path,
+                timeout=aiohttp.ClientTimeout(total=30, connect=2)
+            ) as response:
+                core_breaker.record_success()
+                response.raise_for_status()
+                return await response.json(loads=orjson.loads, content_type=None)
                 
-        except urllib.error.HTTPError as e:
-            raise HTTPException(status_code=e.code, detail=f"Core container HTTP error: {e.reason}")
-        except urllib.error.URLError as e:
-            raise HTTPException(status_code=503, detail=f"Could not connect to core container: {str(e)}")
-        except socket.timeout:
+        except aiohttp.ClientResponseError as e:
+            raise HTTPException(status_code=e.status, detail=f"Core container HTTP error: {e.message}")
+        except asyncio.TimeoutError:
+            core_breaker.record_failure()
             raise HTTPException(status_code=504, detail="Core container request timed out")
+        except aiohttp.ClientConnectionError as e:
+            core_breaker.record_failure()
+            raise HTTPException(status_code=503, detail=f"Could not connect to core container: {str(e)}")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Manual scan request failed: {str(e)}")
     
+    @app.post("/manual/scan", response_class=ORJSONResponse)
+    async def api_manual_scan(request: Request):
+        """Proxy manual scan requests to core container"""
+        # Forward the raw query string as-is (no body needed)
+        query_string = request.scope.get("query_string", b"")
+        scan_path = f"/manual/scan?{query_string.decode('latin-1')}" if query_string else "/manual/scan"
+        
+        pending = pending_scans.get(scan_path)
+        if pending is None:
+            pending = pending_scans[scan_path] = asyncio.ensure_future(post_manual_scan(scan_path))
+            pending.add_done_callback(lambda _: pending_scans.pop(scan_path, None))
+        
+        return await asyncio.shield(pending)
+    
     # Simple scan tracking (since we can't reliably access docker logs from container)
-    scan_tracking = {"last_scan_time": None, "scanning": False}
+    scan_tracking = _ScanTracking()
     
     @app.post("/api/scan/track")
     async def track_scan_start():
         """Called when a scan is initiated to track timing"""
-        from datetime import datetime
-        scan_tracking["last_scan_time"] = datetime.now()
-        scan_tracking["scanning"] = True
+        # Only used for elapsed-time math, so a monotonic clock is enough
+        scan_tracking.last_scan_time = time.monotonic()
+        scan_tracking.scanning = True
         return {"status": "tracked"}
     
-    @app.get("/api/scan/status")
-    async def api_scan_status():
-        """Proxy scan status requests to core container for detailed progress"""
-        import urllib.request
-        import urllib.error
-        import json
-        import os
-        import socket
-        
-        # Get core container connection details
-        core_host = os.environ.get("CORE_API_HOST", "nfoguard-core")
-        core_port = os.environ.get("CORE_API_PORT", "8080")
-        
+    # Concurrent status polls share one in-flight core request, and its result
+    # is reused briefly so several open UI tabs don't multiply core load
+    STATUS_REUSE_SECONDS = 0.25
+    status_poll = {"inflight": None, "fetched_at": 0.0, "value": None}
+    
+    async def fetch_core_scan_status() -> dict:
+        """Fetch detailed scan progress from the core container"""
+        if not core_breaker.allow():
+            return {"scanning": False, "message": "Core container unavailable"}
         try:
             # Call core container's detailed scan status endpoint
-            status_url = f"http://{core_host}:{core_port}/api/scan/status"
-            req = urllib.request.Request(status_url)
-            
-            with urllib.request.urlopen(req, timeout=5) as response:
-                status_data = json.loads(response.read().decode())
-                return status_data
+            async with app.state.core_session.get("/api/scan/status") as response:
+                core_breaker.record_success()
+                if response.status == 404:
+                    # Core container doesn't have the endpoint, fallback to simple tracking
+                    return {"scanning": False, "message": "Detailed status not available"}
+                if response.status >= 400:
+                    return {"scanning": False, "message": f"Core container error: {response.status}"}
+                return await response.json(loads=orjson.loads, content_type=None)
                 
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                # Core container doesn't have the endpoint, fallback to simple tracking
-                return {"scanning": False, "message": "Detailed status not available"}
-            else:
-                return {"scanning": False, "message": f"Core container error: {e.code}"}
-        except (urllib.error.URLError, socket.timeout):
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            core_breaker.record_failure()
             return {"scanning": False, "message": "Core container unavailable"}
         except json.JSONDecodeError:
             return {"scanning": False, "message": "Invalid response from core container"}
         except Exception as e:
-            return {"scanning": False, "message": f"Unable to check scan status: {str(e)}"}
\ No newline at end of file
+            return {"scanning": False, "message": f"Unable to check scan status: {str(e)}"}
+    
+    async def render_scan_status() -> tuple:
+        """Fetch scan status and pre-render its JSON body and weak ETag"""
+        body = orjson.dumps(await fetch_core_scan_status())
+        return body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    
+    def store_scan_status(task: asyncio.Task) -> None:
+        status_poll["inflight"] = None
+        if not task.cancelled() and task.exception() is None:
+            status_poll["value"] = task.result()
+            status_poll["fetched_at"] = time.monotonic()
+    
+    @app.get("/api/scan/status")
+    async def api_scan_status(request: Request):
+        """Proxy scan status requests to core container for detailed progress"""
+        if (status_poll["value"] is not None
+                and time.monotonic() - status_poll["fetched_at"] < STATUS_REUSE_SECONDS):
+            body, etag = status_poll["value"]
+        else:
+            inflight = status_poll["inflight"]
+            if inflight is None:
+                inflight = status_poll["inflight"] = asyncio.ensure_future(render_scan_status())
+                inflight.add_done_callback(store_scan_status)
+            
+            # Shield so a disconnecting client doesn't cancel the fetch for other waiters
+            body, etag = await asyncio.shield(inflight)
+        
+        # Browsers revalidate on every poll; unchanged status costs a bodiless 304
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
\ No newline at end of file
@@ -2,46 +2,120 @@
 """
 External API clients for TMDB, OMDb, and Jellyseerr
 """
-import json
+import functools
+import hashlib
 import os
+import sys
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from urllib.parse import urlencode, quote
-from urllib.request import Request as UrlRequest, urlopen
-from urllib.error import URLError, HTTPError
 
-from core.logging import _log
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from core.logging import _log, _log_enabled
+from utils.cache import DiskCache, TTLCache, cached_call
 
-def _get_json(url: str, timeout: int = 20, headers: Dict[str, str] = None, suppress_404: bool = False) -> Optional[Dict[str, Any]]:
-    """Make GET request and return JSON"""
+
+def _build_session() -> requests.Session:
+    """Create the keep-alive session shared by every external API client"""
+    session = requests.Session()
+    # Transient failures (connection errors, timeouts, rate limiting, 5xx) are
+    # retried with exponential backoff, waiting for Retry-After on 429s;
+    # 4xx answers such as 404 are returned straight away
+    retries = Retry(total=4, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                    respect_retry_after_header=True, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# TMDB, OMDb, TVDB and Jellyseerr are hit many times in a row during scans,
+# so reuse connections instead of paying a TCP/TLS handshake per request
+_session = _build_session()
+
+# Successful responses are kept on disk so release dates and ID lookups
+# aren't fetched again on every scan; set EXTERNAL_CACHE_PATH="" to disable
+_response_cache = DiskCache(os.environ.get("EXTERNAL_CACHE_PATH", "/app/data/cache/external_api.db"))
+
+# How long cached responses stay valid, in seconds
+_TTL_ID_LOOKUP = 30 * 86400     # IMDb -> TMDB/TVDB ID mappings
+_TTL_RELEASE_DATES = 7 * 86400  # Release dates and movie details
+_TTL_EPISODES = 86400           # Season episode lists (new episodes air)
+
+
+# Several APIs answer "not found" with HTTP 200 and an empty or error body;
+# those must not be cached, or an item added upstream stays missing for the TTL
+def _tmdb_find_hit(data: Dict[str, Any]) -> bool:
+    return bool(data.get("movie_results") or data.get("tv_results"))
+
+
+def _tmdb_has_results(data: Dict[str, Any]) -> bool:
+    return bool(data.get("results"))
+
+
+def _tmdb_has_episodes(data: Dict[str, Any]) -> bool:
+    return bool(data.get("episodes"))
+
+
+def _tvdb_hit(data: Dict[str, Any]) -> bool:
+    return data.get("status") == "success" and bool(data.get("data"))
+
+
+def _omdb_hit(data: Dict[str, Any]) -> bool:
+    return data.get("Response") == "True"
+
+
+def _get_json(url: str, timeout: int = 20, headers: Dict[str, str] = None, suppress_404: bool = False,
+              cache_ttl: Optional[float] = None,
+              cache_if: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Make GET request and return JSON, optionally cached on disk for cache_ttl seconds
+    
+    Only non-empty responses are cached, and only those cache_if accepts when given.
+    """
+    cache_key = None
+    if cache_ttl and _response_cache.enabled:
+        # URLs carry API keys, so only a hash of them is stored
+        cache_key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
     try:
-        req = UrlRequest(url, headers=headers or {"Accept": "application/json"})
-        with urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except HTTPError as e:
-        # Handle specific HTTP errors more gracefully
-        if suppress_404 and e.code in [400, 404]:
-            _log("DEBUG", f"TVDB API: {url} - item not found (HTTP {e.code}) - this is expected")
-            return None
-        else:
-            _log("WARNING", f"GET {url} failed: HTTP Error {e.code}: {e.reason}")
+        resp = _session.get(url, headers=headers or {"Accept": "application/json"}, timeout=timeout)
+        if resp.status_code >= 400:
+            # Handle specific HTTP errors more gracefully
+            if suppress_404 and resp.status_code in [400, 404]:
+                _log("DEBUG", f"TVDB API: {url} - item not found (HTTP {resp.status_code}) - this is expected")
+            else:
+                _log("WARNING", f"GET {url} failed: HTTP Error {resp.status_code}: {resp.reason}")
             return None
+        data = orjson.loads(resp.content)
+        if cache_key and data and (cache_if is None or cache_if(data)):
+            _response_cache.set(cache_key, data, cache_ttl)
+        return data
     except Exception as e:
         _log("WARNING", f"GET {url} failed: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=8192)
 def _parse_date_to_iso(date_str: str) -> Optional[str]:
     """Parse various date formats to ISO string"""
     if not date_str or date_str == "N/A":
         return None
     try:
         if len(date_str) == 10 and date_str[4] == "-":  # YYYY-MM-DD
-            dt = datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
-        else:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00")).astimezone(timezone.utc)
+            # Plain dates are midnight UTC; no datetime needed
+            return f"{date.fromisoformat(date_str).isoformat()}T00:00:00+00:00"
+        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00")).astimezone(timezone.utc)
         return dt.isoformat(timespec="seconds")
     except Exception:
         return None
@@ -50,11 +124,14 @@ def _parse_date_to_iso(date_str: str) -> Optional[str]:
 class TVDBClient:
     """The TV Database API client for IMDB to TVDB ID conversion"""
     
+    LOGIN_ATTEMPTS = 3
+    
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.environ.get("TVDB_API_KEY", "")
         self.base_url = "https://api4.thetvdb.com/v4"
         self._token = None
-        self._token_expires = 0
+        self._token_expires = 0.0
+        self._token_lock = threading.Lock()
     
     def _get_token(self) -> Optional[str]:
         """Get TVDB auth token (cached)"""
@@ -62,26 +139,49 @@ class TVDBClient:
             _log("DEBUG", "TVDB: No API key provided")
             return None
             
-        if time.time() < self._token_expires and self._token:
+        if self._token and time.monotonic() < self._token_expires:
             return self._token
+        
+        # Only one thread logs in; the others wait and reuse its token
+        with self._token_lock:
+            if self._token and time.monotonic() < self._token_expires:
+                return self._token
             
-        try:
             _log("DEBUG", f"TVDB: Authenticating with API key: {self.api_key[:8]}...")
-            req = UrlRequest(
-                f"{self.base_url}/login",
-                data=json.dumps({"apikey": self.api_key}).encode('utf-8'),
-                headers={"Content-Type": "application/json"}
-            )
-            with urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-                _log("DEBUG", f"TVDB login response: {data}")
-                if data.get("status") == "success":
-                    self._token = data["data"]["token"]
-                    self._token_expires = time.time() + 3600  # 1 hour
-                    _log("INFO", f"✅ TVDB: Authentication successful")
-                    return self._token
+            for attempt in range(self.LOGIN_ATTEMPTS):
+                try:
+                    resp = _session.post(
+                        f"{self.base_url}/login",
+                        data=orjson.dumps({"apikey": self.api_key}),
+                        headers={"Content-Type": "application/json"},
+                        timeout=10
+                    )
+                except requests.RequestException as e:
+                    _log("WARNING", f"TVDB login attempt {attempt + 1}/{self.LOGIN_ATTEMPTS} failed: {e}")
                 else:
-                    _log("WARNING", f"TVDB login failed: {data}")
+                    # Client errors (bad API key) won't improve on retry
+                    if resp.status_code < 500:
+                        return self._store_token(resp)
+                    _log("WARNING", f"TVDB login attempt {attempt + 1}/{self.LOGIN_ATTEMPTS} failed: HTTP {resp.status_code}")
+                
+                if attempt < self.LOGIN_ATTEMPTS - 1:
+                    time.sleep(2 ** attempt)
+        return None
+    
+    def _store_token(self, resp: requests.Response) -> Optional[str]:
+        """Keep the token from a TVDB login response"""
+        try:
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            _log("DEBUG", f"TVDB login response: {data}")
+            if data.get("status") == "success":
+                self._token = data["data"]["token"]
+                # Tokens are valid for an hour; refresh early so none expires mid-lookup
+                self._token_expires = time.monotonic() + 3000
+                _log("INFO", f"✅ TVDB: Authentication successful")
+                return self._token
+            else:
+                _log("WARNING", f"TVDB login failed: {data}")
         except Exception as e:
             _log("WARNING", f"TVDB login failed: {e}")
         return None
@@ -99,7 +199,8 @@ class TVDBClient:
             headers = {"Authorization": f"Bearer {token}"}
             
             _log("DEBUG", f"TVDB: Searching for {imdb_id} using /search endpoint")
-            data = _get_json(url, headers=headers, suppress_404=True)
+            data = _get_json(url, headers=headers, suppress_404=True, cache_ttl=_TTL_ID_LOOKUP,
+                             cache_if=_tvdb_hit)
             
             if data and data.get("status") == "success" and data.get("data"):
                 series_list = data["data"]
@@ -128,7 +229,8 @@ class TVDBClient:
             # If search didn't work, try the legacy remoteid endpoint
             _log("DEBUG", f"TVDB: Trying legacy remoteid endpoint for {imdb_id}")
             url = f"{self.base_url}/search/remoteid?remoteId={imdb_id}&type=series"
-            data = _get_json(url, headers=headers, suppress_404=True)
+            data = _get_json(url, headers=headers, suppress_404=True, cache_ttl=_TTL_ID_LOOKUP,
+                             cache_if=_tvdb_hit)
             
             if data and data.get("status") == "success" and data.get("data"):
                 series_list = data["data"]
@@ -150,174 +252,209 @@ class TVDBClient:
 class TMDBClient:
     """The Movie Database API client"""
     
+    # Fallback countries tried before any other when the primary country has no release
+    ENGLISH_SPEAKING_COUNTRIES = frozenset({"GB", "CA", "AU", "NZ", "IE"})  # UK, Canada, Australia, New Zealand, Ireland
+    
     def __init__(self, api_key: str = None, primary_country: str = "US"):
         self.api_key = api_key or os.environ.get("TMDB_API_KEY", "")
-        self.primary_country = primary_country.upper()
+        self.primary_country = sys.intern(primary_country.upper())
         self.enabled = bool(self.api_key)
+        self._api_key_qs = urlencode({"api_key": self.api_key})
+        # The digital/physical/theatrical lookups for one movie all need the
+        # same /find and /release_dates responses; keep them for the process
+        self._lookup_cache = TTLCache(maxsize=2048, ttl=3600)
+        # Release type preference, parsed once; rank 0 is the most preferred type
+        self._type_priority = self._parse_tmdb_type_priority()
+        self._type_rank = {release_type: rank for rank, release_type in enumerate(self._type_priority)}
     
-    def _get(self, path: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    def _get(self, path: str, params: Dict[str, Any] = None, cache_ttl: Optional[float] = None,
+             cache_if: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Optional[Dict[str, Any]]:
         """Make GET request to TMDB API"""
         if not self.enabled:
             return None
         
-        params = params or {}
-        params["api_key"] = self.api_key
-        url = f"https://api.themoviedb.org/3{path}?{urlencode(params)}"
-        return _get_json(url, timeout=20)
+        if params:
+            url = f"https://api.themoviedb.org/3{path}?{urlencode(params)}&{self._api_key_qs}"
+        else:
+            url = f"https://api.themoviedb.org/3{path}?{self._api_key_qs}"
+        return _get_json(url, timeout=20, cache_ttl=cache_ttl, cache_if=cache_if)
     
     def find_by_imdb(self, imdb_id: str) -> Optional[Dict[str, Any]]:
         """Find movie by IMDb ID"""
-        result = self._get(f"/find/{quote(imdb_id)}", {"external_source": "imdb_id"})
+        return cached_call(self._lookup_cache, ("find", imdb_id), self._find_by_imdb, imdb_id)
+    
+    def _find_by_imdb(self, imdb_id: str) -> Optional[Dict[str, Any]]:
+        result = self._get(f"/find/{quote(imdb_id)}", {"external_source": "imdb_id"},
+                           cache_ttl=_TTL_ID_LOOKUP, cache_if=_tmdb_find_hit)
         if result and result.get("movie_results"):
             return result["movie_results"][0]
         return None
     
+    def _release_dates(self, tmdb_id: int) -> Optional[Dict[str, Any]]:
+        """Get the /release_dates document for a movie"""
+        return cached_call(
+            self._lookup_cache, ("release_dates", tmdb_id),
+            self._get, f"/movie/{tmdb_id}/release_dates",
+            cache_ttl=_TTL_RELEASE_DATES, cache_if=_tmdb_has_results
+        )
+    
+    def _releases_by_country(self, tmdb_id: int) -> Dict[str, List[Tuple[int, str]]]:
+        """Parseable (type, ISO date) releases for a movie, keyed by TMDB country code"""
+        return cached_call(self._lookup_cache, ("releases_by_country", tmdb_id),
+                           self._build_releases_by_country, tmdb_id)
+    
+    def _build_releases_by_country(self, tmdb_id: int) -> Dict[str, List[Tuple[int, str]]]:
+        release_dates = self._release_dates(tmdb_id)
+        releases_by_country: Dict[str, List[Tuple[int, str]]] = {}
+        if not release_dates:
+            return releases_by_country
+        
+        # Single pass over the document; releases keep their TMDB order
+        for entry in release_dates.get("results", []):
+            # TMDB country codes are already upper-case ISO 3166-1
+            country = entry.get("iso_3166_1") or ""
+            available_releases = releases_by_country.setdefault(country, [])
+            for release in entry.get("release_dates", []):
+                release_date = release.get("release_date")
+                if release_date:
+                    parsed_date = _parse_date_to_iso(release_date)
+                    if parsed_date:
+                        available_releases.append((release.get("type"), parsed_date))
+        return releases_by_country
+    
     def get_movie_details(self, tmdb_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed movie information"""
-        return self._get(f"/movie/{tmdb_id}")
+        return self._get(f"/movie/{tmdb_id}", cache_ttl=_TTL_RELEASE_DATES)
     
-    def get_digital_release_date(self, imdb_id: str) -> Optional[str]:
-        """Get digital release date for a movie"""
-        _log("INFO", f"🔍 TMDB: Looking for digital release date for {imdb_id}")
+    def get_release_summary(self, imdb_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get digital, physical and theatrical release dates for a movie in one pass
+        
+        Shares a single /find and /release_dates lookup between the three
+        release types. Dates are ISO strings or None when not available.
+        
+        Returns:
+            Dict with tmdb_id, digital, physical, theatrical and source_country
+            (the country the digital date came from), or None if the movie
+            isn't on TMDB
+        """
+        _log("DEBUG", f"🔍 TMDB: Looking for release dates for {imdb_id}")
         movie = self.find_by_imdb(imdb_id)
         if not movie:
             _log("WARNING", f"❌ TMDB: Movie not found for {imdb_id}")
             return None
         
         tmdb_id = movie.get("id")
-        _log("INFO", f"✅ TMDB: Found movie ID {tmdb_id} for {imdb_id}")
+        _log("DEBUG", f"✅ TMDB: Found movie ID {tmdb_id} for {imdb_id}")
         if not tmdb_id:
             return None
         
-        release_dates = self._get(f"/movie/{tmdb_id}/release_dates")
-        if not release_dates:
-            _log("WARNING", f"❌ TMDB: No release dates data for movie {tmdb_id}")
-            return None
+        summary = {
+            "tmdb_id": tmdb_id,
+            "digital": None,
+            "physical": None,
+            "theatrical": None,
+            "source_country": None,
+        }
         
-        _log("INFO", f"🔍 TMDB: Got release dates data, looking for {self.primary_country} digital releases")
+        releases_by_country = self._releases_by_country(tmdb_id)
+        if not releases_by_country:
+            _log("WARNING", f"❌ TMDB: No release dates data for movie {tmdb_id}")
+            return summary
         
         # Debug: Show all available countries
-        countries = [entry.get("iso_3166_1") for entry in release_dates.get("results", [])]
-        _log("INFO", f"📍 TMDB: Available countries: {countries}")
-        
-        for entry in release_dates.get("results", []):
-            country = entry.get("iso_3166_1", "").upper()
-            if country != self.primary_country:
-                continue
-                
-            _log("INFO", f"🎯 TMDB: Found {country} release data")
-            releases = entry.get("release_dates", [])
-            _log("INFO", f"🎬 TMDB: Release types available: {[r.get('type') for r in releases]}")
-            
-            # Collect all available releases with their types and dates
-            available_releases = []
-            for release in releases:
-                release_type = release.get("type")
-                release_date = release.get("release_date")
-                _log("INFO", f"📅 TMDB: Type {release_type}, Date: {release_date}")
-                
-                if release_date:
-                    parsed_date = _parse_date_to_iso(release_date)
-                    if parsed_date:
-                        available_releases.append((release_type, parsed_date))
-            
-            # Apply TMDB release type priority order
-            tmdb_priority = self._get_tmdb_type_priority()
-            for preferred_type in tmdb_priority:
-                for release_type, parsed_date in available_releases:
-                    if release_type == preferred_type:
-                        release_type_names = {
-                            1: "Premiere", 2: "Limited Theatrical", 3: "Theatrical", 
-                            4: "Digital", 5: "Physical", 6: "TV Premiere"
-                        }
-                        type_name = release_type_names.get(release_type, f"Type {release_type}")
-                        _log("INFO", f"✅ TMDB: Selected {type_name} release date: {parsed_date} (priority: {tmdb_priority})")
-                        return parsed_date
+        _log("DEBUG", f"📍 TMDB: Available countries: {list(releases_by_country)}")
+        
+        for available_type, parsed_date in releases_by_country.get(self.primary_country, []):
+            if available_type == 3 and summary["theatrical"] is None:
+                summary["theatrical"] = parsed_date  # Theatrical release
+            elif available_type == 5 and summary["physical"] is None:
+                summary["physical"] = parsed_date  # Physical release
+        
+        digital = self._select_digital_release(imdb_id, releases_by_country)
+        if digital:
+            summary["source_country"], summary["digital"] = digital
+        return summary
+    
+    def get_digital_release_date(self, imdb_id: str) -> Optional[str]:
+        """Get digital release date for a movie"""
+        summary = self.get_release_summary(imdb_id)
+        return summary["digital"] if summary else None
+    
+    def _select_digital_release(self, imdb_id: str,
+                                releases_by_country: Dict[str, List[Tuple[int, str]]]) -> Optional[Tuple[str, str]]:
+        """Pick the (country, ISO date) digital release, falling back to other countries"""
+        tmdb_priority = self._get_tmdb_type_priority()
+        # The per-country lines below run for every movie; skip them unless debugging
+        debug = _log_enabled("DEBUG")
+        
+        if self.primary_country in releases_by_country:
+            available_releases = releases_by_country[self.primary_country]
+            if debug:
+                _log("DEBUG", f"🎯 TMDB: Found {self.primary_country} release data")
+                _log("DEBUG", f"🎬 TMDB: Release types available: {[release_type for release_type, _ in available_releases]}")
+            selected = self._select_by_type_priority(available_releases)
+            if selected:
+                release_type, parsed_date = selected
+                _log("INFO", f"✅ TMDB: Selected {self._release_type_name(release_type)} release date: {parsed_date} (priority: {tmdb_priority})")
+                return self.primary_country, parsed_date
         
         _log("WARNING", f"❌ TMDB: No release dates found for {imdb_id} in {self.primary_country}")
         
         # Fallback: First try English-speaking countries, then any country
-        english_speaking_countries = {"GB", "CA", "AU", "NZ", "IE"}  # UK, Canada, Australia, New Zealand, Ireland
-        
-        # First pass: Try English-speaking countries
-        _log("INFO", f"🇺🇸 TMDB: Trying English-speaking countries fallback for {imdb_id}")
-        for entry in release_dates.get("results", []):
-            country = entry.get("iso_3166_1", "").upper()
-            if country not in english_speaking_countries:
+        if debug:
+            _log("DEBUG", f"🇺🇸 TMDB: Trying English-speaking countries fallback for {imdb_id}")
+        for country, available_releases in releases_by_country.items():
+            if country not in self.ENGLISH_SPEAKING_COUNTRIES:
                 continue
-                
-            _log("INFO", f"🎯 TMDB: Checking English-speaking country {country}")
-            
-            releases = entry.get("release_dates", [])
-            if not releases:
-                continue
-            
-            # Collect all available releases with their types and dates
-            available_releases = []
-            for release in releases:
-                release_type = release.get("type")
-                release_date = release.get("release_date")
-                
-                if release_date:
-                    parsed_date = _parse_date_to_iso(release_date)
-                    if parsed_date:
-                        available_releases.append((release_type, parsed_date))
             
-            # Apply TMDB release type priority order
-            tmdb_priority = self._get_tmdb_type_priority()
-            for preferred_type in tmdb_priority:
-                for release_type, parsed_date in available_releases:
-                    if release_type == preferred_type:
-                        release_type_names = {
-                            1: "Premiere", 2: "Limited Theatrical", 3: "Theatrical", 
-                            4: "Digital", 5: "Physical", 6: "TV Premiere"
-                        }
-                        type_name = release_type_names.get(release_type, f"Type {release_type}")
-                        _log("INFO", f"✅ TMDB: Using English-speaking {country} {type_name} release date: {parsed_date}")
-                        return parsed_date
-        
-        # Second pass: Try any remaining country as last resort
-        _log("INFO", f"🌍 TMDB: Trying any available country as last resort for {imdb_id}")
-        for entry in release_dates.get("results", []):
-            country = entry.get("iso_3166_1", "").upper()
-            if country in english_speaking_countries or country == self.primary_country:
+            if debug:
+                _log("DEBUG", f"🎯 TMDB: Checking English-speaking country {country}")
+            selected = self._select_by_type_priority(available_releases)
+            if selected:
+                release_type, parsed_date = selected
+                _log("INFO", f"✅ TMDB: Using English-speaking {country} {self._release_type_name(release_type)} release date: {parsed_date}")
+                return country, parsed_date
+        
+        if debug:
+            _log("DEBUG", f"🌍 TMDB: Trying any available country as last resort for {imdb_id}")
+        for country, available_releases in releases_by_country.items():
+            if country in self.ENGLISH_SPEAKING_COUNTRIES or country == self.primary_country:
                 continue  # Already tried these
-                
-            _log("INFO", f"🎯 TMDB: Checking fallback country {country}")
-            
-            releases = entry.get("release_dates", [])
-            if not releases:
-                continue
-            
-            # Collect all available releases with their types and dates
-            available_releases = []
-            for release in releases:
-                release_type = release.get("type")
-                release_date = release.get("release_date")
-                
-                if release_date:
-                    parsed_date = _parse_date_to_iso(release_date)
-                    if parsed_date:
-                        available_releases.append((release_type, parsed_date))
             
-            # Apply TMDB release type priority order
-            tmdb_priority = self._get_tmdb_type_priority()
-            for preferred_type in tmdb_priority:
-                for release_type, parsed_date in available_releases:
-                    if release_type == preferred_type:
-                        release_type_names = {
-                            1: "Premiere", 2: "Limited Theatrical", 3: "Theatrical", 
-                            4: "Digital", 5: "Physical", 6: "TV Premiere"
-                        }
-                        type_name = release_type_names.get(release_type, f"Type {release_type}")
-                        _log("INFO", f"✅ TMDB: Using fallback {country} {type_name} release date: {parsed_date}")
-                        return parsed_date
+            if debug:
+                _log("DEBUG", f"🎯 TMDB: Checking fallback country {country}")
+            selected = self._select_by_type_priority(available_releases)
+            if selected:
+                release_type, parsed_date = selected
+                _log("INFO", f"✅ TMDB: Using fallback {country} {self._release_type_name(release_type)} release date: {parsed_date}")
+                return country, parsed_date
         
         _log("WARNING", f"❌ TMDB: No release dates found for {imdb_id} in any country")
         return None
     
+    def _select_by_type_priority(self, available_releases: List[Tuple[int, str]]) -> Optional[Tuple[int, str]]:
+        """Pick the (type, date) release whose type ranks highest in the TMDB type priority"""
+        ranked = [release for release in available_releases if release[0] in self._type_rank]
+        if not ranked:
+            return None
+        return min(ranked, key=lambda release: self._type_rank[release[0]])
+    
+    @staticmethod
+    def _release_type_name(release_type: int) -> str:
+        release_type_names = {
+            1: "Premiere", 2: "Limited Theatrical", 3: "Theatrical", 
+            4: "Digital", 5: "Physical", 6: "TV Premiere"
+        }
+        return release_type_names.get(release_type, f"Type {release_type}")
+    
     def _get_tmdb_type_priority(self) -> List[int]:
-        """Get TMDB release type priority order from environment"""
+        """Get TMDB release type priority order"""
+        return self._type_priority
+    
+    @staticmethod
+    def _parse_tmdb_type_priority() -> List[int]:
+        """Parse TMDB release type priority order from environment"""
         # Default priority: Digital first, then Physical, then Theatrical, then others
         default_priority = "4,5,3,2,6,1"  # digital,physical,theatrical,limited,tv,premiere
         
@@ -337,55 +474,18 @@ class TMDBClient:
     
     def get_theatrical_release_date(self, imdb_id: str) -> Optional[str]:
         """Get theatrical release date for a movie"""
-        movie = self.find_by_imdb(imdb_id)
-        if not movie:
-            return None
-        
-        tmdb_id = movie.get("id")
-        if not tmdb_id:
-            return None
-        
-        release_dates = self._get(f"/movie/{tmdb_id}/release_dates")
-        if not release_dates:
-            return None
-        
-        for entry in release_dates.get("results", []):
-            if entry.get("iso_3166_1", "").upper() != self.primary_country:
-                continue
-            
-            for release in entry.get("release_dates", []):
-                if release.get("type") == 3 and release.get("release_date"):  # Theatrical release
-                    return _parse_date_to_iso(release["release_date"])
-        
-        return None
+        summary = self.get_release_summary(imdb_id)
+        return summary["theatrical"] if summary else None
     
     def get_physical_release_date(self, imdb_id: str) -> Optional[str]:
         """Get physical release date (DVD/Blu-ray) for a movie"""
-        movie = self.find_by_imdb(imdb_id)
-        if not movie:
-            return None
-        
-        tmdb_id = movie.get("id")
-        if not tmdb_id:
-            return None
-        
-        release_dates = self._get(f"/movie/{tmdb_id}/release_dates")
-        if not release_dates:
-            return None
-        
-        for entry in release_dates.get("results", []):
-            if entry.get("iso_3166_1", "").upper() != self.primary_country:
-                continue
-            
-            for release in entry.get("release_dates", []):
-                if release.get("type") == 5 and release.get("release_date"):  # Physical release
-                    return _parse_date_to_iso(release["release_date"])
-        
-        return None
+        summary = self.get_release_summary(imdb_id)
+        return summary["physical"] if summary else None
     
     def get_tv_season_episodes(self, tv_id: int, season_number: int) -> Dict[int, str]:
         """Get episode air dates for a TV season"""
-        result = self._get(f"/tv/{tv_id}/season/{season_number}")
+        result = self._get(f"/tv/{tv_id}/season/{season_number}",
+                           cache_ttl=_TTL_EPISODES, cache_if=_tmdb_has_episodes)
         episodes = {}
         
         if result:
@@ -404,15 +504,19 @@ class OMDbClient:
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.environ.get("OMDB_API_KEY", "")
         self.enabled = bool(self.api_key)
+        self._api_key_qs = urlencode({"apikey": self.api_key})
+        self._details_cache = TTLCache(maxsize=2048, ttl=3600)
     
     def get_movie_details(self, imdb_id: str) -> Optional[Dict[str, Any]]:
         """Get movie details from OMDb"""
         if not self.enabled:
             return None
         
-        params = {"i": imdb_id, "apikey": self.api_key}
-        url = f"http://www.omdbapi.com/?{urlencode(params)}"
-        result = _get_json(url, timeout=15)
+        return cached_call(self._details_cache, imdb_id, self._get_movie_details, imdb_id)
+    
+    def _get_movie_details(self, imdb_id: str) -> Optional[Dict[str, Any]]:
+        url = f"http://www.omdbapi.com/?i={quote(imdb_id)}&{self._api_key_qs}"
+        result = _get_json(url, timeout=15, cache_ttl=_TTL_RELEASE_DATES, cache_if=_omdb_hit)
         
         if result and result.get("Response") == "True":
             return result
@@ -443,9 +547,8 @@ class OMDbClient:
         if not self.enabled:
             return {}
         
-        params = {"i": imdb_id, "Season": str(season_number), "apikey": self.api_key}
-        url = f"http://www.omdbapi.com/?{urlencode(params)}"
-        result = _get_json(url, timeout=15)
+        url = f"http://www.omdbapi.com/?i={quote(imdb_id)}&Season={int(season_number)}&{self._api_key_qs}"
+        result = _get_json(url, timeout=15, cache_ttl=_TTL_EPISODES, cache_if=_omdb_hit)
         
         episodes = {}
         if result and result.get("Response") == "True":
@@ -468,19 +571,21 @@ class JellyseerrClient:
         self.base_url = (base_url or os.environ.get("JELLYSEERR_URL", "")).rstrip("/")
         self.api_key = api_key or os.environ.get("JELLYSEERR_API_KEY", "")
         self.enabled = bool(self.base_url and self.api_key)
+        self._details_cache = TTLCache(maxsize=2048, ttl=3600)
     
-    def _get(self, path: str) -> Optional[Dict[str, Any]]:
+    def _get(self, path: str, cache_ttl: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """Make GET request to Jellyseerr API"""
         if not self.enabled:
             return None
         
         url = f"{self.base_url}/api/v1{path}"
         headers = {"X-Api-Key": self.api_key, "Accept": "application/json"}
-        return _get_json(url, timeout=20, headers=headers)
+        return _get_json(url, timeout=20, headers=headers, cache_ttl=cache_ttl)
     
     def get_movie_details(self, tmdb_id: int) -> Optional[Dict[str, Any]]:
         """Get movie details from Jellyseerr"""
-        return self._get(f"/movie/{tmdb_id}")
+        return cached_call(self._details_cache, tmdb_id,
+                           self._get, f"/movie/{tmdb_id}", cache_ttl=_TTL_RELEASE_DATES)
     
     def get_digital_release_dates(self, tmdb_id: int) -> List[str]:
         """Get digital release date candidates from Jellyseerr"""
@@ -531,45 +636,44 @@ class ExternalClientManager:
         self.omdb = OMDbClient()
         self.jellyseerr = JellyseerrClient()
         self.tvdb = TVDBClient()
+        # Maximum years a digital/physical date may trail theatrical before smart
+        # validation prefers theatrical (default: 10 years)
+        self.max_release_date_gap_years = int(os.environ.get("MAX_RELEASE_DATE_GAP_YEARS", "10"))
+        
+        # Release-date sources are independent network calls; run them side by side
+        self.executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="external-lookup")
     
     def get_release_date_by_priority(self, imdb_id: str, priority_order: List[str], enable_smart_validation: bool = True) -> Optional[Tuple[str, str]]:
         """Get release date using configurable priority order with smart date validation"""
         
-        # Get all possible release dates
-        release_options = {}
-        
+        # Get all possible release dates. TMDB returns every release type from
+        # one /release_dates lookup; OMDb is queried alongside it.
+        lookups = {}
         if self.tmdb.enabled:
-            # Digital release
-            digital_date = self.tmdb.get_digital_release_date(imdb_id)
-            if digital_date:
-                release_options["digital"] = (digital_date, "tmdb:digital")
-            
-            # Physical release
-            physical_date = self.tmdb.get_physical_release_date(imdb_id)
-            if physical_date:
-                release_options["physical"] = (physical_date, "tmdb:physical")
-            
-            # Theatrical release
-            theatrical_date = self.tmdb.get_theatrical_release_date(imdb_id)
-            if theatrical_date:
-                release_options["theatrical"] = (theatrical_date, "tmdb:theatrical")
+            lookups["tmdb"] = self.executor.submit(self.tmdb.get_release_summary, imdb_id)
+        if self.omdb.enabled:
+            lookups["omdb"] = self.executor.submit(self.omdb.get_dvd_release_date, imdb_id)
+        
+        release_options = {}
+        tmdb_summary = lookups["tmdb"].result() if "tmdb" in lookups else None
+        if tmdb_summary:
+            for release_type in ("digital", "physical", "theatrical"):
+                release_date = tmdb_summary[release_type]
+                if release_date:
+                    release_options[release_type] = (release_date, f"tmdb:{release_type}")
         
         # Add OMDb options
-        if self.omdb.enabled:
-            omdb_date = self.omdb.get_dvd_release_date(imdb_id)
+        if "omdb" in lookups:
+            omdb_date = lookups["omdb"].result()
             if omdb_date and "physical" not in release_options:
                 release_options["physical"] = (omdb_date, "omdb:dvd")
         
         # Add Jellyseerr digital releases
-        if self.jellyseerr.enabled and self.tmdb.enabled and "digital" not in release_options:
-            tmdb_movie = self.tmdb.find_by_imdb(imdb_id)
-            if tmdb_movie:
-                tmdb_id = tmdb_movie.get("id")
-                if tmdb_id:
-                    jellyseerr_dates = self.jellyseerr.get_digital_release_dates(tmdb_id)
-                    if jellyseerr_dates:
-                        earliest_jellyseerr = min(jellyseerr_dates)
-                        release_options["digital"] = (earliest_jellyseerr, "jellyseerr:digital")
+        if self.jellyseerr.enabled and tmdb_summary and "digital" not in release_options:
+            jellyseerr_dates = self.jellyseerr.get_digital_release_dates(tmdb_summary["tmdb_id"])
+            if jellyseerr_dates:
+                earliest_jellyseerr = min(jellyseerr_dates)
+                release_options["digital"] = (earliest_jellyseerr, "jellyseerr:digital")
         
         # Smart date validation: Check if priority order makes sense given the actual dates
         if enable_smart_validation and len(release_options) > 1:
@@ -586,43 +690,38 @@ class ExternalClientManager:
     
     def _validate_date_choice(self, release_options: Dict[str, Tuple[str, str]], priority_order: List[str]) -> Optional[Tuple[str, str]]:
         """Validate date choice and prefer theatrical if digital/physical are unreasonably late"""
-        from datetime import datetime, timezone
-        import os
-        
-        # Get configuration for maximum gap (default: 10 years)
-        max_reasonable_gap_years = int(os.environ.get("MAX_RELEASE_DATE_GAP_YEARS", "10"))
-        
-        # Parse all available dates
-        parsed_dates = {}
-        for release_type, (date_str, source) in release_options.items():
-            try:
-                parsed_dates[release_type] = (datetime.fromisoformat(date_str.replace('Z', '+00:00')), source)
-            except Exception:
-                continue
+        max_reasonable_gap_years = self.max_release_date_gap_years
         
-        if not parsed_dates or "theatrical" not in parsed_dates:
+        if "theatrical" not in release_options:
             return None  # No smart validation possible without theatrical date
         
-        theatrical_date, theatrical_source = parsed_dates["theatrical"]
+        # Dates come from _parse_date_to_iso, so only parse the ones we compare
+        try:
+            theatrical_date = datetime.fromisoformat(release_options["theatrical"][0])
+        except ValueError:
+            return None
         
         # Check each priority option against theatrical date
         for priority in priority_order:
-            if priority == "theatrical":
+            if priority == "theatrical" or priority not in release_options:
                 continue  # Skip theatrical in this validation
             
-            if priority in parsed_dates:
-                priority_date, priority_source = parsed_dates[priority]
-                
-                # Calculate the gap in years
-                gap = (priority_date - theatrical_date).days / 365.25
-                
-                # If the gap is too large, skip this priority and continue
-                if gap > max_reasonable_gap_years:
-                    print(f"[SMART VALIDATION] {priority} date {priority_date.strftime('%Y-%m-%d')} is {gap:.1f} years after theatrical {theatrical_date.strftime('%Y-%m-%d')}, preferring theatrical")
-                    continue
-                
-                # This priority option is reasonable, use it
-                return (priority_date.isoformat(timespec="seconds"), f"{priority_source} (validated)")
+            date_str, priority_source = release_options[priority]
+            try:
+                priority_date = datetime.fromisoformat(date_str)
+            except ValueError:
+                continue
+            
+            # Calculate the gap in years
+            gap = (priority_date - theatrical_date).days / 365.25
+            
+            # If the gap is too large, skip this priority and continue
+            if gap > max_reasonable_gap_years:
+                _log("INFO", f"[SMART VALIDATION] {priority} date {date_str[:10]} is {gap:.1f} years after theatrical {release_options['theatrical'][0][:10]}, preferring theatrical")
+                continue
+            
+            # This priority option is reasonable, use it as-is
+            return (date_str, f"{priority_source} (validated)")
         
         # If all priority options are unreasonable, fall back to theatrical
         if "theatrical" in release_options:
@@ -667,7 +766,8 @@ class ExternalClientManager:
         # Try TMDB first if available
         if self.tmdb.enabled:
             # Find TV show by IMDB ID
-            tv_find_result = self.tmdb._get(f"/find/{imdb_id}", {"external_source": "imdb_id"})
+            tv_find_result = self.tmdb._get(f"/find/{imdb_id}", {"external_source": "imdb_id"},
+                                            cache_ttl=_TTL_ID_LOOKUP, cache_if=_tmdb_find_hit)
             if tv_find_result and tv_find_result.get("tv_results"):
                 tv_show = tv_find_result["tv_results"][0]
                 tv_id = tv_show.get("id")
@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 """Enhanced Radarr API client with improved import date detection"""
 
-import json
+import functools
+import random
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode, urljoin
-from urllib.request import Request as UrlRequest, urlopen
-from urllib.error import URLError, HTTPError
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 
 from core.logging import _log
+from utils.cache import TTLCache, cached_call
 
 # Import path mapper for proper path handling
 try:
@@ -26,6 +31,18 @@ except ImportError:
             
     path_mapper = DummyPathMapper()
 
+# Title and path normalisation for matching history paths against a movie
+_TITLE_DOT_TRANS = str.maketrans(" :-_", "....")
+_PATH_DOT_TRANS = str.maketrans(" -_", "...", "[]")
+
+@functools.lru_cache(maxsize=4096)
+def _iso_utc(date_str: str) -> str:
+    """Normalise a Radarr timestamp to a UTC ISO string with second precision"""
+    if date_str.endswith("Z"):
+        date_str = date_str[:-1] + "+00:00"
+    return datetime.fromisoformat(date_str).astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
 # Import database client for enhanced performance
 try:
     from clients.radarr_db_client import RadarrDbClient
@@ -44,8 +61,18 @@ class RadarrClient:
     EVENT_TYPE_RETAGGED = 6   # Files were tagged
     EVENT_TYPE_RENAMED = 8    # Files were renamed
 
+    # String event types some Radarr versions report, mapped to numeric values
+    _EVENT_TYPE_MAP = {
+        "grabbed": EVENT_TYPE_GRABBED,
+        "downloadFolderImported": EVENT_TYPE_IMPORTED,
+        "movieFileImported": EVENT_TYPE_IMPORTED,
+        "downloadFailed": EVENT_TYPE_FAILED,
+        "movieFileRenamed": EVENT_TYPE_RENAMED,
+        "movieFileDeleted": 5  # Not in our constants but common
+    }
+
     # Event types that indicate real imports
-    REAL_IMPORT_EVENT_TYPES = [EVENT_TYPE_IMPORTED]  # Only trust actual "imported" events
+    REAL_IMPORT_EVENT_TYPES = frozenset({EVENT_TYPE_IMPORTED})  # Only trust actual "imported" events
     
     # These are now handled by path_mapper, but keeping for backward compatibility
     DOWNLOAD_PATH_INDICATORS = [
@@ -55,12 +82,28 @@ class RadarrClient:
         'usenet', 'torrent', 'radarr', 'completed', 'processing'
     ]
     
+    # Large enough that most movies' history comes back in a single request
+    HISTORY_PAGE_SIZE = 500
+    
+    # History pages requested ahead of the one being scanned once a movie has
+    # more than one page of history
+    HISTORY_PREFETCH_PAGES = 4
+    
     def __init__(self, base_url: str, api_key: str, timeout: int = 45, retries: int = 3):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.retries = max(0, retries)
         
+        # Independent API requests (movie info, history pages) are issued side by side
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="radarr-api")
+        # Keep-alive connections to Radarr, enough for every pool worker
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        # Movie records looked up by IMDb ID or Radarr ID, reused across a scan
+        self._movie_cache = TTLCache(maxsize=4096, ttl=300)
+        
         # Initialize database client - REQUIRED for operation
         self.db_client = None
         if RadarrDbClient:
@@ -76,6 +119,13 @@ class RadarrClient:
         else:
             _log("ERROR", "❌ DATABASE ONLY MODE: RadarrDbClient not available - check dependencies")
 
+    def close(self):
+        """Close pooled API and database connections"""
+        self._pool.shutdown(wait=False)
+        self._session.close()
+        if self.db_client:
+            self.db_client.close()
+
     def _get(self, path: str, params: Dict[str, Any] = None) -> Optional[Any]:
         """Make GET request to Radarr API with retries"""
         if not self.api_key:
@@ -94,25 +144,44 @@ class RadarrClient:
                     url = url + ("&" if "?" in url else "?") + urlencode(params)
                 
                 _log("DEBUG", f"Radarr API Request: {url}")
-                req = UrlRequest(url, headers={"Accept": "application/json"})
-                
-                with urlopen(req, timeout=self.timeout) as resp:
-                    data = resp.read().decode("utf-8")
-                    result = json.loads(data)
-                    return result
+                resp = self._session.get(url, headers={"Accept": "application/json"}, timeout=self.timeout)
+                resp.raise_for_status()
+                return orjson.loads(resp.content)
                     
-            except (URLError, HTTPError, json.JSONDecodeError) as e:
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
                 last_err = e
+                # Client errors (bad request, auth, missing movie) won't change on retry
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status in (400, 401, 403, 404):
+                    _log("WARNING", f"Radarr GET {path} failed: {e}")
+                    return None
+                
                 _log("DEBUG", f"Radarr API attempt {attempt + 1} failed: {e}")
-                time.sleep(min(2 ** attempt, 5))  # Exponential backoff
                 attempt += 1
+                if attempt <= self.retries:
+                    # Exponential backoff with jitter so parallel lookups don't retry in lockstep
+                    time.sleep(min(2 ** (attempt - 1), 5) * (0.5 + random.random()))
         
         _log("WARNING", f"Radarr GET {path} failed after {self.retries + 1} attempts: {last_err}")
         return None
 
+    def invalidate(self, movie_id: int, imdb_id: Optional[str] = None) -> None:
+        """Drop cached lookups for a movie after it was changed in Radarr"""
+        movie_info = self._movie_cache.pop(("movie", movie_id))
+        imdb_id = imdb_id or (movie_info or {}).get("imdbId")
+        if imdb_id:
+            self._movie_cache.pop(("imdb", imdb_id if imdb_id.startswith("tt") else f"tt{imdb_id}"))
+
+    def _movie_info(self, movie_id: int) -> Optional[Dict[str, Any]]:
+        """Get a movie record from Radarr API"""
+        return cached_call(self._movie_cache, ("movie", movie_id), self._get, f"/api/v3/movie/{movie_id}")
+
     def movie_by_imdb(self, imdb_id: str) -> Optional[Dict[str, Any]]:
         """Find movie by IMDb ID - DATABASE ONLY mode"""
         imdb_id = imdb_id if imdb_id.startswith("tt") else f"tt{imdb_id}"
+        return cached_call(self._movie_cache, ("imdb", imdb_id), self._movie_by_imdb, imdb_id)
+
+    def _movie_by_imdb(self, imdb_id: str) -> Optional[Dict[str, Any]]:
         _log("DEBUG", f"Looking up movie by IMDb ID: {imdb_id}")
         
         # Database required - no API fallback
@@ -133,197 +202,179 @@ class RadarrClient:
         _log("ERROR", "Database client required for movie lookup - API mode disabled")
         return None
 
-    def _analyze_event_for_import(self, event: Dict[str, Any], movie_info: Dict[str, Any] = None) -> Tuple[bool, str, Optional[str]]:
+    @classmethod
+    def _event_type(cls, event: Dict[str, Any]) -> Optional[int]:
+        """Get a history event's type as a number, mapping the string names some Radarr versions use"""
+        event_type = event.get("eventType")
+        if not event_type:
+            return None
+        
+        # Convert event type to int or handle string types
+        try:
+            if isinstance(event_type, str) and not event_type.isdigit():
+                # Map string event types to numeric values
+                return cls._EVENT_TYPE_MAP.get(event_type, 0)
+            return int(event_type)
+        except (ValueError, TypeError):
+            _log("DEBUG", f"Unknown event type: {event_type}")
+            return None
+
+    @staticmethod
+    def _event_data(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get a history event's data as a dict, parsing it if Radarr sent it as a JSON string"""
+        event_data = event.get("data", {})
+        if isinstance(event_data, str):
+            if not event_data.startswith("{"):
+                return None
+            try:
+                event_data = orjson.loads(event_data)
+            except orjson.JSONDecodeError as e:
+                _log("DEBUG", f"Failed to parse event data JSON: {e}")
+                return None
+        return event_data if isinstance(event_data, dict) else None
+
+    def _analyze_event_for_import(self, event: Dict[str, Any], movie_info: Dict[str, Any] = None,
+                                  event_data: Optional[Dict[str, Any]] = None) -> Tuple[bool, str, Optional[str], Optional[str]]:
         """
         Analyze a history event to determine if it's a real import.
         
         Args:
             event: The history event to analyze
             movie_info: Optional movie information to validate paths against
+            event_data: The event's data if the caller already parsed it
         
         Returns:
-            (is_real_import, reason, date_iso)
+            (is_real_import, reason, date_iso, matched_source), where matched_source
+            is the lower-cased source path/title that decided a real import
         """
         event_type = event.get("eventType")
         date_str = event.get("date")
-        event_data = event.get("data", {})
         
         # Parse date
         date_iso = None
         if date_str:
             try:
-                date_iso = datetime.fromisoformat(date_str.replace("Z", "+00:00")).astimezone(timezone.utc).isoformat(timespec="seconds")
+                date_iso = _iso_utc(date_str)
             except Exception:
                 date_iso = None
         
         if not date_iso:
-            return False, "no_valid_date", None
+            return False, "no_valid_date", None, None
             
         # Convert event type to int if needed
-        try:
-            event_type_int = int(event_type) if isinstance(event_type, str) and event_type.isdigit() else event_type
-        except (ValueError, TypeError):
-            event_type_int = None
+        event_type_int = self._event_type(event)
 
         # Check if event type indicates import
         if event_type_int not in self.REAL_IMPORT_EVENT_TYPES:
-            return False, f"event_type_not_import({event_type})", date_iso
+            return False, f"event_type_not_import({event_type})", date_iso, None
+        
+        if event_data is None:
+            event_data = self._event_data(event)
+        
+        # Get all possible source paths/titles, cleaned up and unique in the
+        # order below so sourcePath is always checked before the other fields
+        sources: Dict[str, None] = {}
         
-        # Get all possible source paths/titles
-        source_items = []
+        def add_source(value: Any) -> None:
+            cleaned = str(value).lower().strip() if value else ""
+            if cleaned:
+                sources[cleaned] = None
         
         # Get both sourcePath and importedPath if available
         if event_data:
-            for key in ['sourcePath', 'droppedPath', 'path', 'sourceTitle', 'importedPath']:
-                if event_data.get(key):
-                    source_items.append(event_data[key])
+            for key in ('sourcePath', 'droppedPath', 'path', 'sourceTitle', 'importedPath'):
+                add_source(event_data.get(key))
                     
         # Also check event root for these fields
-        for key in ['sourcePath', 'sourceTitle', 'importedPath']:
-            if event.get(key):
-                source_items.append(event[key])
+        for key in ('sourcePath', 'sourceTitle', 'importedPath'):
+            add_source(event.get(key))
         
-        # Clean up and make unique
-        source_items = [str(s).lower().strip() for s in source_items if s]
-        source_items = list(set(source_items))  # Remove duplicates
+        source_items = list(sources)
         
         if not source_items:
-            return False, "no_source_paths", date_iso
+            return False, "no_source_paths", date_iso, None
             
         # If we have movie info, look for title/year match
         if movie_info:
-            movie_title = movie_info.get('title', '').lower().replace(':', '.').replace(' ', '.')
+            movie_title = (movie_info.get('title', '') or '').lower().translate(_TITLE_DOT_TRANS)
             movie_year = str(movie_info.get('year', ''))
             
             for source in source_items:
                 # Clean up source text for comparison
-                source_clean = source.replace(' ', '.').replace('_', '.').replace('-', '.')
+                source_clean = source.translate(_PATH_DOT_TRANS)
                 
                 # Check if both title and year are in the source
                 if movie_title and movie_year:
                     if movie_title in source_clean and movie_year in source_clean:
                         _log("DEBUG", f"✅ Match found - Title: {movie_title}, Year: {movie_year}")
-                        return True, "matched_title_and_year", date_iso
+                        return True, "matched_title_and_year", date_iso, source
                         
                 # Also check for downloads path as secondary validation
                 if path_mapper.is_download_path(source):
                     _log("DEBUG", f"Source is from downloads: {source}")
-                    return True, "from_downloads_path", date_iso
+                    return True, "from_downloads_path", date_iso, source
                     
             _log("DEBUG", f"⚠️ No match found in sources: {source_items}")
-            return False, "no_title_year_match", date_iso
+            return False, "no_title_year_match", date_iso, None
         
         # Fallback to basic path validation if no movie info
         for source in source_items:
             if path_mapper.is_download_path(source):
-                return True, "basic_download_path_match", date_iso
+                return True, "basic_download_path_match", date_iso, source
                 
-        return False, "no_download_path_match", date_iso
+        return False, "no_download_path_match", date_iso, None
 
-    def earliest_import_event_optimized(self, movie_id: int) -> Optional[str]:
+    def earliest_import_event_optimized(self, movie_id: int, direction: str = "ascending") -> Optional[str]:
         """
         Find earliest real import event with optimized querying.
         Stops as soon as we find valid import events instead of loading everything.
+        
+        With direction="descending" history is walked newest first, so the most
+        recent real import is returned instead (see latest_import_event).
         """
         _log("INFO", f"Finding earliest import for movie_id {movie_id}")
         
-        # Get movie info for path validation
-        movie_info = self._get(f"/api/v3/movie/{movie_id}")
+        page_size = self.HISTORY_PAGE_SIZE
+        
+        # Get movie info for path validation together with the first page of imports
+        movie_future = self._pool.submit(self._movie_info, movie_id)
+        first_page = self._get("/api/v3/history", self._history_params(movie_id, 1, page_size, self.EVENT_TYPE_IMPORTED, direction))
+        movie_info = movie_future.result()
         if not movie_info or not isinstance(movie_info, dict):
             _log("ERROR", f"Could not get movie info for ID {movie_id}")
             return None
         
+        # Normalise the movie's identifiers once instead of for every event
+        # "[imdb-tt123]" and "[tt123]" both contain the bare ID, so one substring test covers them
+        movie_imdb = (movie_info.get("imdbId", "") or "").lower()
+        movie_title = (movie_info.get("title", "") or "").lower()
+        clean_title = movie_title.translate(_TITLE_DOT_TRANS)
+        movie_year = str(movie_info.get("year", ""))
+        
         earliest_real_import = None
-        first_grab = None
-        page = 1
-        page_size = 50  # Smaller pages for faster iteration
         total_processed = 0
+        page = 0
         
-        while page <= 20:  # Safety limit
-            # Get history in chronological order
-            data = self._get("/api/v3/history", {
-                "movieId": str(movie_id),
-                "page": page,
-                "pageSize": page_size,
-                "sortKey": "date",
-                "sortDirection": "ascending"
-            })
-            
-            if not data:
-                break
-                
-            items = data if isinstance(data, list) else data.get("records", [])
-            if not items:
-                break
-            
+        # Ask Radarr for import events only; grabs are only needed if no import matches.
+        # Only the generator keeps page 1, so each page can be freed once scanned.
+        pages = self._iter_history_pages(movie_id, page_size, self.EVENT_TYPE_IMPORTED, direction,
+                                         first_page=first_page)
+        first_page = None
+        for items in pages:
+            page += 1
             _log("DEBUG", f"Page {page}: Processing {len(items)} events")
             
             for event in items:
                 total_processed += 1
-                event_type = event.get("eventType")
-                if not event_type:
-                    continue
-                    
-                # Convert event type to int or handle string types
-                try:
-                    if isinstance(event_type, str):
-                        # Map string event types to numeric values
-                        string_to_numeric = {
-                            "grabbed": self.EVENT_TYPE_GRABBED,
-                            "downloadFolderImported": self.EVENT_TYPE_IMPORTED,
-                            "movieFileImported": self.EVENT_TYPE_IMPORTED,
-                            "downloadFailed": self.EVENT_TYPE_FAILED,
-                            "movieFileRenamed": self.EVENT_TYPE_RENAMED,
-                            "movieFileDeleted": 5  # Not in our constants but common
-                        }
-                        event_type = string_to_numeric.get(event_type, 0)
-                    else:
-                        event_type = int(event_type)
-                except (ValueError, TypeError):
-                    _log("DEBUG", f"Unknown event type: {event_type}")
-                    continue
-                
-                # Check for grab events (type 1) - but validate it's a real download
-                if event_type == self.EVENT_TYPE_GRABBED and not first_grab:
-                    if event.get("date"):
-                        try:
-                            # Get event data to check if this is a real grab with download info
-                            event_data = event.get("data", {})
-                            if isinstance(event_data, str):
-                                try:
-                                    event_data = json.loads(event_data)
-                                except (json.JSONDecodeError, AttributeError):
-                                    event_data = {}
-                            
-                            # Check if this grab has actual download/indexer info
-                            source_title = event_data.get("sourceTitle", "")
-                            indexer = event_data.get("indexer", "")
-                            
-                            # Only count grabs that have actual download metadata
-                            if source_title or indexer:
-                                first_grab = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(timezone.utc).isoformat(timespec="seconds")
-                                _log("DEBUG", f"Found real grab event with source '{source_title}' from '{indexer}' at {first_grab}")
-                            else:
-                                _log("DEBUG", f"Skipping grab event without download info at {event.get('date')}")
-                        except Exception:
-                            pass
+                event_type = self._event_type(event)
                 
                 # Only process import events (type 3)
                 if event_type != self.EVENT_TYPE_IMPORTED:
                     continue
                     
-                # Get imported path from event data
-                imported_path = None
-                event_data = event.get("data", {})
-                
-                # Handle both string and dict data
-                if isinstance(event_data, str):
-                    try:
-                        event_data = json.loads(event_data)
-                    except (json.JSONDecodeError, AttributeError) as e:
-                        _log("DEBUG", f"Failed to parse event data JSON: {e}")
-                        continue
-                elif not isinstance(event_data, dict):
+                # Get imported path from event data, parsed once and shared with the analysis below
+                event_data = self._event_data(event)
+                if event_data is None:
                     continue
                 
                 imported_path = event_data.get("importedPath", "")
@@ -331,85 +382,57 @@ class RadarrClient:
                     continue
                     
                 imported_path = imported_path.lower()
-                    
-                movie_imdb = (movie_info.get("imdbId", "") or "").lower()
-                movie_title = (movie_info.get("title", "") or "").lower()
-                movie_year = str(movie_info.get("year", ""))
                 
                 # First try IMDb ID match
-                # First try IMDb ID match
-                if movie_imdb and (
-                    f"[imdb-{movie_imdb}]" in imported_path or
-                    f"[{movie_imdb}]" in imported_path or
-                    movie_imdb in imported_path
-                ):
+                if movie_imdb and movie_imdb in imported_path:
                     _log("INFO", f"Found potential IMDb match in {event_type} event: {imported_path}")
-                    date_iso = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(timezone.utc).isoformat(timespec="seconds")
+                    date_iso = _iso_utc(event["date"])
                     _log("INFO", f"✅ FOUND IMPORT: exact IMDb match at {date_iso}")
                     earliest_real_import = date_iso
                     break
 
                 # Then try title/year match with fuzzy path cleaning
-                if movie_title and movie_year:
-                    # Clean strings for comparison
-                    clean_title = movie_title.replace(" ", ".").replace(":", ".").replace("-", ".").replace("_", ".").lower()
-                    clean_path = imported_path.replace(" ", ".").replace("-", ".").replace("_", ".").replace("[", "").replace("]", "").lower()
+                if clean_title and movie_year:
+                    # Clean path for comparison
+                    clean_path = imported_path.translate(_PATH_DOT_TRANS)
                     
                     # Look for both title and year in the path
                     if clean_title in clean_path and movie_year in clean_path:
-                        date_iso = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(timezone.utc).isoformat(timespec="seconds")
+                        date_iso = _iso_utc(event["date"])
                         _log("INFO", f"Found potential title/year match for event type {event_type}: {clean_title} ({movie_year})")
                         _log("INFO", f"✅ FOUND IMPORT at {date_iso}")
                         earliest_real_import = date_iso
                         break
                             
                 # Fallback to normal import analysis
-                is_real, reason, date_iso = self._analyze_event_for_import(event, movie_info)
+                is_real, reason, date_iso, matched_source = self._analyze_event_for_import(event, movie_info, event_data)
                 if is_real and date_iso:
-                    source_path = (event.get("data", {}).get("sourcePath", "") or 
-                                 event.get("data", {}).get("droppedPath", "") or 
-                                 event.get("sourcePath", "") or
-                                 event.get("data", {}).get("importedPath", "") or
-                                 event.get("importedPath", "") or "").lower()
+                    # The analysis already matched title and year in this source
+                    if reason == "matched_title_and_year":
+                        _log("INFO", f"✅ FOUND IMPORT: Title/year match at {date_iso}")
+                        earliest_real_import = date_iso
+                        break
                     
-                    if source_path:
-                        # Check for path match
-                        movie_imdb = (movie_info.get("imdbId", "") or "").lower()
-                        if movie_imdb and (
-                            f"[imdb-{movie_imdb}]" in source_path or
-                            f"[{movie_imdb}]" in source_path or
-                            movie_imdb in source_path
-                        ):
-                            _log("INFO", f"✅ FOUND IMPORT: IMDb match in path at {date_iso}")
-                            earliest_real_import = date_iso
-                            break
-                        
-                        # Check for title/year match
-                        movie_title = (movie_info.get("title", "") or "").lower().replace(":", ".").replace(" ", ".")
-                        movie_year = str(movie_info.get("year", ""))
-                        if movie_title and movie_year and movie_title in source_path and movie_year in source_path:
-                            _log("INFO", f"✅ FOUND IMPORT: Title/year match at {date_iso}")
-                            earliest_real_import = date_iso
-                            break
+                    # A download path alone isn't enough, it must also name the movie
+                    if movie_imdb and movie_imdb in matched_source:
+                        _log("INFO", f"✅ FOUND IMPORT: IMDb match in path at {date_iso}")
+                        earliest_real_import = date_iso
+                        break
                 elif event_type == 3:
                     _log("DEBUG", f"⚠️  Skipped import event: {reason}")
             
             # If we found a real import, no need to continue
             if earliest_real_import:
                 break
-                
-            # If we got less than page size, we've seen all events
-            if len(items) < page_size:
-                break
-                
-            page += 1
+        pages.close()
         
-        _log("INFO", f"Processed {total_processed} events across {page-1} pages")
+        _log("INFO", f"Processed {total_processed} events across {page} pages")
         
         if earliest_real_import:
             _log("INFO", f"✅ Using earliest real import: {earliest_real_import}")
             return earliest_real_import
-            
+        
+        first_grab = self._first_real_grab(movie_id, page_size, direction)
         if first_grab:
             _log("WARNING", f"⚠️  No real imports found, using grab date: {first_grab}")
             return first_grab
@@ -417,6 +440,40 @@ class RadarrClient:
         _log("ERROR", f"❌ No import or grab events found for movie_id {movie_id}")
         return None
 
+    def latest_import_event(self, movie_id: int) -> Optional[str]:
+        """
+        Find the most recent real import event.
+        
+        Walks history newest first, so a movie that has been imported usually
+        needs a single page.
+        """
+        return self.earliest_import_event_optimized(movie_id, direction="descending")
+
+    def _first_real_grab(self, movie_id: int, page_size: int, direction: str = "ascending") -> Optional[str]:
+        """Date of the first grab in history order that carries download/indexer info"""
+        for items in self._iter_history_pages(movie_id, page_size, self.EVENT_TYPE_GRABBED, direction):
+            for event in items:
+                # Check for grab events (type 1) - but validate it's a real download
+                if self._event_type(event) != self.EVENT_TYPE_GRABBED or not event.get("date"):
+                    continue
+                try:
+                    # Get event data to check if this is a real grab with download info
+                    event_data = self._event_data(event) or {}
+                    
+                    # Check if this grab has actual download/indexer info
+                    source_title = event_data.get("sourceTitle", "")
+                    indexer = event_data.get("indexer", "")
+                    
+                    # Only count grabs that have actual download metadata
+                    if source_title or indexer:
+                        first_grab = _iso_utc(event["date"])
+                        _log("DEBUG", f"Found real grab event with source '{source_title}' from '{indexer}' at {first_grab}")
+                        return first_grab
+                    _log("DEBUG", f"Skipping grab event without download info at {event.get('date')}")
+                except Exception:
+                    pass
+        return None
+
     def movie_files(self, movie_id: int) -> List[Dict[str, Any]]:
         """Get movie files for a movie - DATABASE ONLY mode"""
         if self.db_client:
@@ -463,72 +520,95 @@ class RadarrClient:
         _log("ERROR", "Database client required for import date detection - API mode disabled")
         return None, "radarr:db.not_configured"
 
-    def _get_earliest_import_date(self, movie_id: int, movie_info: Dict) -> Optional[str]:
-        """Get the earliest import date from Radarr history."""
-        _log("INFO", f"Finding earliest import for movie_id {movie_id}")
+    def _get_earliest_import_date(self, movie_id: int, movie_info: Dict, direction: str = "ascending") -> Optional[str]:
+        """
+        Get the earliest (or with direction="descending", latest) import date from Radarr history.
         
-        earliest_real_import = None
-        earliest_grab_date = None
-        page = 1
-        page_size = 50
-        total_events = 0
-
-        # Get full movie history
-        while True:
-            # Get page of history
-            history_data = self._get_movie_history_page(movie_id, page, page_size)
-            if not history_data:
-                break
-            
-            # Process events on this page
-            for event in history_data:
-                event_type = event.get("eventType")
-                if not event_type:
-                    continue
-                
-                # Parse event date
-                event_date = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(timezone.utc).isoformat(timespec="seconds")
-                
-                # Track earliest grab date as fallback (EventType 1)
-                if event_type == 1 and not earliest_grab_date:
-                    earliest_grab_date = event_date
-                    _log("DEBUG", f"Found first grab event at {earliest_grab_date}")
-                    continue
-                
-                # Look for import events (EventType 3)
-                if event_type == 3:
-                    try:
-                        data = json.loads(event.get("data", "{}"))
-                        if data.get("importedPath"):
-                            _log("INFO", f"✅ FOUND IMPORT at {event_date}")
-                            earliest_real_import = event_date
-                            break
-                    except (json.JSONDecodeError, AttributeError):
-                        continue
-            
-            # Break if we found an import
-            if earliest_real_import:
-                break
-
-            total_events += len(history_data)
-            page += 1
-
-        _log("INFO", f"Processed {total_events} events across {page}")
-
-        if earliest_real_import:
-            return earliest_real_import
-        if earliest_grab_date:
-            _log("WARNING", f"⚠️  No EventType 3 (import) found, using grab date: {earliest_grab_date}")
-            return earliest_grab_date
-        return None
+        Kept for older callers; this is earliest_import_event_optimized. movie_info
+        is not used, the scan loads (and caches) the movie record itself.
+        """
+        return self.earliest_import_event_optimized(movie_id, direction)
 
-    def _get_movie_history_page(self, movie_id: int, page: int, page_size: int) -> List[Dict[str, Any]]:
-        """Get a page of movie history."""
-        data = self._get("/api/v3/history", {
+    def _history_params(self, movie_id: int, page: int, page_size: int,
+                        event_type: Optional[int] = None, direction: str = "ascending") -> Dict[str, Any]:
+        """Query parameters for one page of a movie's history, sorted by date"""
+        params = {
             "movieId": str(movie_id),
             "page": page,
             "pageSize": page_size,
             "sortKey": "date",
-            "sortDirection": "ascending"
-        })
-        return data if isinstance(data, list) else data.get("records", [])
\ No newline at end of file
+            "sortDirection": direction
+        }
+        if event_type is not None:
+            # Filtered server-side; scanners still check each event's type
+            params["eventType"] = event_type
+        return params
+
+    @staticmethod
+    def _history_records(data: Any) -> List[Dict[str, Any]]:
+        """Events from a history response, which is either a list or a paged object"""
+        if not data:
+            return []
+        return data if isinstance(data, list) else data.get("records", [])
+
+    def _get_movie_history_page(self, movie_id: int, page: int, page_size: int,
+                                event_type: Optional[int] = None, direction: str = "ascending") -> List[Dict[str, Any]]:
+        """Get a page of movie history, optionally only events of one type."""
+        data = self._get("/api/v3/history", self._history_params(movie_id, page, page_size, event_type, direction))
+        return self._history_records(data)
+
+    def _iter_history_pages(self, movie_id: int, page_size: int, event_type: Optional[int] = None,
+                            direction: str = "ascending", max_pages: int = 20,
+                            first_page: Any = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield a movie's history one page at a time, oldest first by default.
+        
+        Page 1 is fetched on its own, and its totalRecords bounds how many
+        pages are read. When the caller asks for more, the next
+        HISTORY_PREFETCH_PAGES pages are requested side by side so the scan
+        doesn't wait for them one at a time. Requests still pending when the
+        caller stops iterating are cancelled.
+        
+        Args:
+            movie_id: Radarr movie ID
+            page_size: Events per page
+            event_type: Only request events of this type
+            direction: "ascending" (oldest first) or "descending" (newest first)
+            max_pages: Safety limit on the number of pages read
+            first_page: Response for page 1 if it was already fetched
+        """
+        pending: Dict[int, Future] = {}
+        try:
+            for page in range(1, max_pages + 1):
+                if page == 1:
+                    data = first_page if first_page is not None else \
+                        self._get("/api/v3/history", self._history_params(movie_id, page, page_size, event_type, direction))
+                    items = self._history_records(data)
+                    
+                    # Paged responses say how many events there are; don't read past the last page
+                    total_records = data.get("totalRecords") if isinstance(data, dict) else None
+                    if isinstance(total_records, int):
+                        max_pages = min(max_pages, -(-total_records // page_size))
+                    first_page = data = None
+                else:
+                    # The caller wants more than one page: keep the next few in flight
+                    for ahead in range(page, min(page + self.HISTORY_PREFETCH_PAGES - 1, max_pages) + 1):
+                        if ahead not in pending:
+                            pending[ahead] = self._pool.submit(self._get_movie_history_page, movie_id, ahead,
+                                                               page_size, event_type, direction)
+                    items = pending.pop(page).result()
+                
+                if not items:
+                    return
+                yield items
+                
+                # Don't hold on to a page the caller has finished with
+                page_len, items = len(items), None
+                
+                # A short page is the last one; max_pages may have been lowered
+                # from totalRecords after range() was evaluated
+                if page_len < page_size or page >= max_pages:
+                    return
+        finally:
+            for future in pending.values():
+                future.cancel()
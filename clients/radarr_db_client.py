@@ -6,11 +6,14 @@ Provides high-performance access to Radarr's SQLite/PostgreSQL database
 
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from core.logging import _log
@@ -47,6 +50,32 @@ class RadarrDbClient:
         self.db_user = db_user
         self.db_password = db_password
         
+        # PostgreSQL connections are pooled so each query doesn't pay for a new
+        # connection and login; size the pool with RADARR_DB_POOL_MAX
+        self._pg_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+        # The pool raises PoolError when exhausted, so borrowers queue on this instead
+        self._pg_slots: Optional[threading.BoundedSemaphore] = None
+        # SQLite connections are kept open per thread so their page cache survives
+        # between queries; all of them are tracked so close() can release them
+        self._sqlite_local = threading.local()
+        self._sqlite_conns: List[sqlite3.Connection] = []
+        self._sqlite_lock = threading.Lock()
+        if self.db_type == "postgresql":
+            pool_max = int(os.environ.get("RADARR_DB_POOL_MAX", "10"))
+            self._pg_slots = threading.BoundedSemaphore(pool_max)
+            try:
+                self._pg_pool = psycopg2.pool.ThreadedConnectionPool(
+                    1, pool_max,
+                    host=self.db_host,
+                    port=self.db_port,
+                    database=self.db_name,
+                    user=self.db_user,
+                    password=self.db_password
+                )
+            except Exception as e:
+                _log("ERROR", f"Failed to connect to Radarr database: {e}")
+                raise
+        
         self._test_connection()
         
     @classmethod
@@ -93,12 +122,10 @@ class RadarrDbClient:
     def _test_connection(self) -> None:
         """Test database connection on initialization"""
         try:
-            conn = self._get_connection()
-            if conn:
-                conn.close()
-                _log("INFO", f"Connected to Radarr {self.db_type} database successfully")
-            else:
-                raise Exception("Failed to create connection")
+            with self._conn() as conn:
+                if not conn:
+                    raise Exception("Failed to create connection")
+            _log("INFO", f"Connected to Radarr {self.db_type} database successfully")
         except Exception as e:
             _log("ERROR", f"Failed to connect to Radarr database: {e}")
             raise
@@ -106,8 +133,19 @@ class RadarrDbClient:
     def _get_connection(self) -> Union[sqlite3.Connection, psycopg2.extensions.connection]:
         """Get database connection"""
         if self.db_type == "sqlite":
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = getattr(self._sqlite_local, "conn", None)
+            if conn is None:
+                # Autocommit, so no read transaction stays open between queries.
+                # Radarr owns the file: only per-connection read settings are changed,
+                # never its journal mode.
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA cache_size=-20000")     # ~20 MB page cache
+                conn.execute("PRAGMA mmap_size=268435456")   # 256 MB memory-mapped reads
+                conn.execute("PRAGMA temp_store=MEMORY")
+                self._sqlite_local.conn = conn
+                with self._sqlite_lock:
+                    self._sqlite_conns.append(conn)
             return conn
         elif self.db_type == "postgresql":
             conn = psycopg2.connect(
@@ -121,6 +159,65 @@ class RadarrDbClient:
         else:
             raise ValueError(f"Unsupported database type: {self.db_type}")
     
+    @contextmanager
+    def _conn(self) -> Iterator[Union[sqlite3.Connection, psycopg2.extensions.connection]]:
+        """
+        Borrow a database connection for the duration of a with block
+        
+        PostgreSQL connections come from the pool and are returned to it
+        afterwards (closed instead if the connection broke); when every pooled
+        connection is in use the caller waits for one to be returned. SQLite uses this
+        thread's long-lived connection, which stays open after the block unless
+        it failed.
+        """
+        if self._pg_pool is not None:
+            pool = self._pg_pool
+            with self._pg_slots:
+                conn = pool.getconn()
+                broken = False
+                try:
+                    yield conn
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    broken = True
+                    raise
+                finally:
+                    pool.putconn(conn, close=broken or bool(conn.closed))
+        elif self.db_type == "sqlite":
+            conn = self._get_connection()
+            try:
+                yield conn
+            except sqlite3.Error:
+                # Start over with a fresh connection on the next query
+                self._drop_sqlite_connection(conn)
+                raise
+        else:
+            conn = self._get_connection()
+            try:
+                yield conn
+            finally:
+                conn.close()
+    
+    def _drop_sqlite_connection(self, conn: sqlite3.Connection) -> None:
+        """Close a cached SQLite connection and forget it"""
+        if getattr(self._sqlite_local, "conn", None) is conn:
+            self._sqlite_local.conn = None
+        with self._sqlite_lock:
+            if conn in self._sqlite_conns:
+                self._sqlite_conns.remove(conn)
+        conn.close()
+    
+    def close(self) -> None:
+        """Close every pooled or cached database connection"""
+        if self._pg_pool is not None:
+            self._pg_pool.closeall()
+            self._pg_pool = None
+        with self._sqlite_lock:
+            conns, self._sqlite_conns = self._sqlite_conns, []
+        for conn in conns:
+            conn.close()
+        # Threads still holding a closed connection open a new one on next use
+        self._sqlite_local = threading.local()
+    
     def get_movie_by_imdb(self, imdb_id: str) -> Optional[Dict[str, Any]]:
         """
         Find movie by IMDb ID using database query
@@ -148,7 +245,7 @@ class RadarrDbClient:
             query = query.replace("%s", "?")
         
         try:
-            with self._get_connection() as conn:
+            with self._conn() as conn:
                 if self.db_type == "postgresql":
                     cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 else:
@@ -212,7 +309,7 @@ class RadarrDbClient:
             grab_query = grab_query.replace("%s", "?")
         
         try:
-            with self._get_connection() as conn:
+            with self._conn() as conn:
                 if self.db_type == "postgresql":
                     cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 else:
@@ -277,7 +374,7 @@ class RadarrDbClient:
             query = query.replace("%s", "?")
         
         try:
-            with self._get_connection() as conn:
+            with self._conn() as conn:
                 if self.db_type == "postgresql":
                     cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 else:
@@ -331,7 +428,7 @@ class RadarrDbClient:
             query = query.replace("%s", "?")
         
         try:
-            with self._get_connection() as conn:
+            with self._conn() as conn:
                 if self.db_type == "postgresql":
                     cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 else:
@@ -420,7 +517,7 @@ class RadarrDbClient:
         results = {}
         
         try:
-            with self._get_connection() as conn:
+            with self._conn() as conn:
                 if self.db_type == "postgresql":
                     cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 else:
@@ -468,7 +565,7 @@ class RadarrDbClient:
         }
         
         try:
-            with self._get_connection() as conn:
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 for stat_name, query in queries.items():
@@ -503,7 +600,7 @@ class RadarrDbClient:
         
         try:
             # Test 1: Basic connection
-            with self._get_connection() as conn:
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 # Test 2: Check if we can read (basic query)
@@ -2,26 +2,47 @@
 """
 Enhanced Sonarr API client for TV show metadata and episode management
 """
-import json
+import bisect
+import threading
 import time
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlencode
-from urllib.request import Request as UrlRequest, urlopen
-from urllib.error import URLError, HTTPError
+
+import requests
 
 from core.logging import _log
+from utils.cache import TTLCache
 
 
 class SonarrClient:
     """Enhanced Sonarr API client for TV series and episode management"""
     
-    def __init__(self, base_url: str, api_key: str, timeout: int = 45, retries: int = 3):
+    def __init__(self, base_url: str, api_key: str, timeout: int = 45, retries: int = 3,
+                 series_index_ttl: float = 300.0, series_index_min_refresh: float = 30.0):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.retries = max(0, retries)
         self.enabled = bool(self.base_url and self.api_key)
+        self.series_index_ttl = series_index_ttl
+        # Minimum gap between /series fetches, also when a lookup misses or a fetch failed
+        self.series_index_min_refresh = series_index_min_refresh
+        # (IMDb ID -> series, sorted numeric IMDb IDs (tt0123456 -> 123456), matching series),
+        # replaced as one tuple so readers never mix two builds
+        self._series_snapshot: Tuple[Dict[str, Dict[str, Any]], List[int], List[Dict[str, Any]]] = ({}, [], [])
+        self._series_index_built_at: Optional[float] = None
+        self._series_index_attempted_at: Optional[float] = None
+        self._series_index_lock = threading.Lock()
+        # (series_id, season) -> {episode_number: episode}
+        self._season_cache = TTLCache(maxsize=1024, ttl=300)
+        # Keep-alive session so repeated lookups reuse the same connection
+        self.session = requests.Session()
+        self.session.headers.update({"X-Api-Key": self.api_key})
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
 
     def _get(self, path: str, params: Dict[str, Any] = None) -> Optional[Any]:
         """Make GET request to Sonarr API with retries"""
@@ -31,29 +52,23 @@ class SonarrClient:
         url = f"{self.base_url}/api/v3{path}"
         if params:
             url += "?" + urlencode(params)
-            
-        headers = {"X-Api-Key": self.api_key}
         
         for attempt in range(self.retries):
             try:
                 _log("DEBUG", f"Sonarr API Request: {url}")
-                req = UrlRequest(url, headers=headers)
+                resp = self.session.get(url, timeout=self.timeout)
                 
-                with urlopen(req, timeout=self.timeout) as resp:
-                    data = resp.read().decode("utf-8")
-                    result = json.loads(data) if data else None
-                    return result
-                    
-            except HTTPError as e:
-                if e.code == 401:
+                if resp.status_code == 401:
                     _log("ERROR", "Sonarr authentication failed - check API key")
                     return None
-                elif e.code == 429:
+                elif resp.status_code == 429:
                     wait_time = (attempt + 1) * 2
                     _log("WARNING", f"Sonarr rate limited, waiting {wait_time}s (attempt {attempt+1}/{self.retries})")
                     time.sleep(wait_time)
+                elif resp.status_code >= 400:
+                    _log("WARNING", f"Sonarr HTTP {resp.status_code} error on attempt {attempt+1}/{self.retries}: {resp.reason}")
                 else:
-                    _log("WARNING", f"Sonarr HTTP {e.code} error on attempt {attempt+1}/{self.retries}: {e.reason}")
+                    return resp.json() if resp.content else None
                     
             except Exception as e:
                 _log("WARNING", f"Sonarr API attempt {attempt+1}/{self.retries} failed: {e}")
@@ -135,25 +150,115 @@ class SonarrClient:
         """Get all series from Sonarr"""
         return self._get("/series") or []
 
+    def _refresh_series_index(self, force: bool = False) -> None:
+        """
+        Rebuild the series index from one /series fetch when it is stale
+        
+        With force, rebuild even if it isn't stale (a lookup missed). Fetches
+        are at least series_index_min_refresh seconds apart, and a failed or
+        empty fetch keeps the previous index and doesn't count as a build.
+        """
+        with self._series_index_lock:
+            now = time.monotonic()
+            stale = self._series_index_built_at is None or now - self._series_index_built_at > self.series_index_ttl
+            if not (stale or force):
+                return
+            if (self._series_index_attempted_at is not None
+                    and now - self._series_index_attempted_at < self.series_index_min_refresh):
+                return
+            self._series_index_attempted_at = now
+            
+            all_series = self.get_all_series()
+            if not all_series:
+                return
+            index = {
+                series["imdbId"].lower(): series
+                for series in all_series if series.get("imdbId")
+            }
+            numeric = sorted((
+                (int(imdb[2:]), series) for imdb, series in index.items()
+                if imdb.startswith("tt") and imdb[2:].isdigit()
+            ), key=lambda item: item[0])
+            self._series_snapshot = (index, [num for num, _ in numeric], [series for _, series in numeric])
+            self._series_index_built_at = now
+
+    def series_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the lowercased IMDb ID -> series map for every series in Sonarr
+        
+        Built from a single /series fetch and rebuilt once it is older than
+        series_index_ttl seconds, so repeated lookups don't refetch the whole
+        library.
+        """
+        self._refresh_series_index()
+        return self._series_snapshot[0]
+
     def series_by_imdb_direct(self, imdb_id: str) -> Optional[Dict[str, Any]]:
-        """Find series by scanning all series for IMDb match (slower but more reliable)"""
-        _log("DEBUG", f"Direct series lookup for IMDb: {imdb_id}")
-        all_series = self.get_all_series()
+        """
+        Find series by IMDb ID in the cached index of all Sonarr series
         
-        target_imdb = imdb_id.lower()
-        for series in all_series:
-            series_imdb = (series.get("imdbId") or "").lower()
-            if series_imdb == target_imdb:
-                _log("INFO", f"Found series via direct lookup: {series.get('title')} (ID: {series.get('id')})")
-                return series
+        A miss rebuilds the index (rate-limited) and looks again, so a series
+        added since the last build is found when its first webhook arrives.
+        """
+        _log("DEBUG", f"Direct series lookup for IMDb: {imdb_id}")
+        series = self.series_index().get(imdb_id.lower())
+        if not series:
+            self._refresh_series_index(force=True)
+            series = self._series_snapshot[0].get(imdb_id.lower())
+        if series:
+            _log("INFO", f"Found series via direct lookup: {series.get('title')} (ID: {series.get('id')})")
+            return series
         
         _log("WARNING", f"No series found with IMDb ID via direct lookup: {imdb_id}")
         return None
 
+    def series_by_nearest_imdb(self, imdb_id: str, max_diff: int = 10) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        Find the series whose numeric IMDb ID is closest to imdb_id
+        
+        Fallback for titles whose IMDb ID differs slightly between Sonarr and
+        NFOGuard. Uses a binary search over the sorted numeric IDs.
+        
+        Returns:
+            (series, difference) if a series is within max_diff, None otherwise
+        """
+        target = imdb_id.lower()
+        if not target.startswith("tt") or not target[2:].isdigit():
+            return None
+        target_num = int(target[2:])
+        
+        self._refresh_series_index()
+        _, ids, series_by_id = self._series_snapshot
+        pos = bisect.bisect_left(ids, target_num)
+        best = None
+        for i in (pos - 1, pos):
+            if 0 <= i < len(ids):
+                diff = abs(ids[i] - target_num)
+                if diff <= max_diff and (best is None or diff < best[1]):
+                    best = (series_by_id[i], diff)
+        return best
+
     def episodes_for_series(self, series_id: int) -> List[Dict[str, Any]]:
         """Get all episodes for a series"""
         return self._get("/episode", {"seriesId": series_id}) or []
 
+    def episode_by_number(self, series_id: int, season: int, episode: int) -> Optional[Dict[str, Any]]:
+        """Get a single episode by season/episode number (season listing cached for 5 minutes)"""
+        key = (series_id, season)
+        season_episodes = self._season_cache.get(key)
+        if season_episodes is None:
+            result = self._get("/episode", {"seriesId": series_id, "seasonNumber": season})
+            if result is None:
+                return None
+            season_episodes = {}
+            for ep in result:
+                try:
+                    season_episodes[int(ep.get("episodeNumber"))] = ep
+                except (TypeError, ValueError):
+                    continue
+            self._season_cache.set(key, season_episodes)
+        return season_episodes.get(episode)
+
     def episode_file(self, episode_file_id: int) -> Optional[Dict[str, Any]]:
         """Get episode file details"""
         return self._get(f"/episodefile/{episode_file_id}")
@@ -165,6 +165,9 @@ class NFOGuardConfig:
         self.max_release_date_gap_years = self._get_int_env("MAX_RELEASE_DATE_GAP_YEARS", 10, 1, 50)
         self.movie_poll_mode = os.environ.get("MOVIE_POLL_MODE", "always").lower()
         self.movie_update_mode = os.environ.get("MOVIE_DATE_UPDATE_MODE", "backfill_only").lower()
+        
+        # Date options: query OMDb even when TMDB already offered a release date
+        self.omdb_always = _bool_env("OMDB_ALWAYS", False)
     
     def _load_tv_settings(self) -> None:
         """Load TV processing settings"""
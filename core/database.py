@@ -5,6 +5,7 @@ Handles database operations for tracking media dates and processing history
 """
 import json
 import threading
+import uuid
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 from contextlib import contextmanager
@@ -12,6 +13,58 @@ from contextlib import contextmanager
 import psycopg2
 import psycopg2.extras
 
+# Hot, fixed-shape queries that are PREPAREd once per connection so PostgreSQL
+# skips parse/analyze/plan on every call. Name -> (parameter types, statement).
+# Columns are listed explicitly: a prepared SELECT * fails with "cached plan
+# must not change result type" once another container adds a column.
+PREPARED_STATEMENTS = {
+    "get_movie_dates": (
+        "varchar",
+        """SELECT imdb_id, path, released, dateadded, source, last_updated, has_video_file
+           FROM movies WHERE imdb_id = $1"""
+    ),
+    "get_episode_date": (
+        "varchar, integer, integer",
+        """SELECT imdb_id, season, episode, aired, dateadded, source, last_updated, has_video_file
+           FROM episodes WHERE imdb_id = $1 AND season = $2 AND episode = $3"""
+    ),
+    "get_series_episodes": (
+        "varchar",
+        """SELECT season, episode, aired, dateadded, source, has_video_file, last_updated
+           FROM episodes WHERE imdb_id = $1 ORDER BY season, episode"""
+    ),
+    "movie_date_counts": (
+        "",
+        """SELECT
+               COUNT(*) FILTER (WHERE dateadded IS NOT NULL) AS with_dates,
+               COUNT(*) FILTER (WHERE dateadded IS NULL OR source = 'no_valid_date_source') AS without_dates,
+               COUNT(*) FILTER (WHERE source = 'no_valid_date_source') AS no_valid_source
+           FROM movies"""
+    ),
+    "episode_date_counts": (
+        "",
+        """SELECT
+               COUNT(*) FILTER (WHERE dateadded IS NOT NULL) AS with_dates,
+               COUNT(*) FILTER (WHERE dateadded IS NULL OR source = 'no_valid_date_source') AS without_dates,
+               COUNT(*) FILTER (WHERE source = 'no_valid_date_source') AS no_valid_source
+           FROM episodes"""
+    ),
+    "recent_activity_count": (
+        "",
+        "SELECT COUNT(*) FROM processing_history WHERE processed_at > NOW() - INTERVAL '7 days'"
+    ),
+    "missing_dates_summary": (
+        "",
+        """SELECT m.with_dates AS movies_with_dates, m.total AS total_movies,
+                  e.with_dates AS episodes_with_dates, e.total AS total_episodes
+           FROM (SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE dateadded IS NOT NULL) AS with_dates
+                 FROM movies) m,
+                (SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE dateadded IS NOT NULL) AS with_dates
+                 FROM episodes) e"""
+    ),
+}
+
+
 class NFOGuardDatabase:
     """PostgreSQL database manager for NFOGuard media tracking and processing history"""
     
@@ -35,20 +88,48 @@ class NFOGuardDatabase:
         self._init_database()
     
     
+    def _connect(self) -> 'psycopg2.extensions.connection':
+        """Open a new PostgreSQL connection with dict rows"""
+        return psycopg2.connect(
+            host=self.db_host,
+            port=self.db_port,
+            database=self.db_name,
+            user=self.db_user,
+            password=self.db_password,
+            cursor_factory=psycopg2.extras.RealDictCursor
+        )
+    
     def _get_connection(self) -> 'psycopg2.extensions.connection':
         """Get thread-local PostgreSQL database connection"""
         if not hasattr(self._local, 'connection'):
-            self._local.connection = psycopg2.connect(
-                host=self.db_host,
-                port=self.db_port,
-                database=self.db_name,
-                user=self.db_user,
-                password=self.db_password,
-                cursor_factory=psycopg2.extras.RealDictCursor
-            )
+            self._local.connection = self._connect()
             self._local.connection.autocommit = True
+            self._local.prepared = set()
         return self._local.connection
     
+    def execute_prepared(self, cursor, name: str, params=()):
+        """
+        Execute a statement from PREPARED_STATEMENTS on the thread-local connection
+        
+        The statement is PREPAREd on first use per connection (tables may not
+        exist yet when the connection is opened) and EXECUTEd afterwards.
+        
+        Args:
+            cursor: Cursor of this thread's connection (from get_connection())
+            name: Key in PREPARED_STATEMENTS
+            params: Statement parameters, in $1..$n order
+        """
+        if name not in self._local.prepared:
+            param_types, statement = PREPARED_STATEMENTS[name]
+            signature = f"({param_types})" if param_types else ""
+            cursor.execute(f"PREPARE {name}{signature} AS {statement}")
+            self._local.prepared.add(name)
+        
+        if params:
+            cursor.execute(f"EXECUTE {name}({', '.join(['%s'] * len(params))})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+    
     def _get_first_value(self, row):
         """Get first value from row from PostgreSQL RealDictCursor"""
         # RealDictCursor returns dict-like objects
@@ -64,7 +145,41 @@ class NFOGuardDatabase:
         except Exception:
             # PostgreSQL uses autocommit - no manual rollback needed
             raise
-    
+
+    def iter_query(self, name: str, query: str, params=None, itersize: int = 1000):
+        """
+        Iterate over query results using a PostgreSQL server-side (named) cursor
+
+        Rows are fetched from the server in batches of ``itersize`` instead of
+        buffering the whole result set client-side, so large reports stay at
+        O(itersize) memory.
+
+        The cursor runs on its own connection rather than the thread-local
+        one: a streaming response resumes the generator on whichever
+        threadpool worker is free, so the thread-local connection could be
+        shared with other queries mid-iteration. The connection is closed
+        when the generator finishes or is closed early.
+
+        Args:
+            name: Cursor name prefix (a unique suffix is appended per call)
+            query: SQL query to execute
+            params: Optional query parameters
+            itersize: Number of rows fetched per network round-trip
+        """
+        # Not autocommit: the named cursor lives in this connection's transaction
+        conn = self._connect()
+        try:
+            cursor = conn.cursor(name=f"{name}_{uuid.uuid4().hex[:12]}")
+            cursor.itersize = itersize
+            try:
+                cursor.execute(query, params)
+                for row in cursor:
+                    yield row
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
     def _init_database(self):
         """Initialize PostgreSQL database tables"""
         with self.get_connection() as conn:
@@ -134,6 +249,107 @@ class NFOGuardDatabase:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_episodes_video ON episodes(has_video_file)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_movies_video ON movies(has_video_file)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_imdb ON processing_history(imdb_id)")
+        # Pattern-ops indexes so anchored imdb_id LIKE 'tt123%' searches use an index range scan
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_movies_imdb_pattern ON movies(imdb_id varchar_pattern_ops)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_series_imdb_pattern ON series(imdb_id varchar_pattern_ops)")
+        self._init_trigram_indexes(cursor)
+        
+        self._init_series_date_stats(cursor)
+    
+    def _init_trigram_indexes(self, cursor):
+        """Create pg_trgm GIN indexes so unanchored '%term%' searches avoid sequential scans"""
+        try:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except psycopg2.Error as e:
+            # Creating extensions can require privileges the NFOGuard user lacks;
+            # searches still work, just without index support
+            print(f"⚠️ pg_trgm extension unavailable, search will not be index-assisted: {e}")
+            return
+        
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_movies_path_trgm ON movies USING gin (path gin_trgm_ops)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_movies_imdb_trgm ON movies USING gin (imdb_id gin_trgm_ops)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_series_path_trgm ON series USING gin (path gin_trgm_ops)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_series_imdb_trgm ON series USING gin (imdb_id gin_trgm_ops)")
+    
+    def _init_series_date_stats(self, cursor):
+        """
+        Initialize the series_date_stats table
+        
+        Holds per-series episode counts (total, with dateadded, with video file)
+        kept current by a row trigger on episodes, so the series list can filter
+        on date completeness without grouping the whole episodes table.
+        """
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION series_date_stats_sync() RETURNS TRIGGER AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    UPDATE series_date_stats SET
+                        total_eps = total_eps - 1,
+                        eps_with_dates = eps_with_dates - (OLD.dateadded IS NOT NULL)::int,
+                        eps_with_video = eps_with_video - COALESCE(OLD.has_video_file, FALSE)::int
+                    WHERE imdb_id = OLD.imdb_id;
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    INSERT INTO series_date_stats (imdb_id, total_eps, eps_with_dates, eps_with_video)
+                    VALUES (NEW.imdb_id, 1, (NEW.dateadded IS NOT NULL)::int, COALESCE(NEW.has_video_file, FALSE)::int)
+                    ON CONFLICT (imdb_id) DO UPDATE SET
+                        total_eps = series_date_stats.total_eps + EXCLUDED.total_eps,
+                        eps_with_dates = series_date_stats.eps_with_dates + EXCLUDED.eps_with_dates,
+                        eps_with_video = series_date_stats.eps_with_video + EXCLUDED.eps_with_video;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        
+        # Create, backfill and attach the trigger atomically. This only runs
+        # when the table is missing, empty or untriggered, so normal startups
+        # neither lock episodes nor recount it. Locking episodes first
+        # serializes concurrent startups (core and web containers) and keeps
+        # writes out until the backfilled counts are in place; every step
+        # re-checks its condition once the lock is held.
+        cursor.execute("""
+            DO $$
+            DECLARE
+                has_trigger BOOLEAN;
+            BEGIN
+                IF to_regclass('series_date_stats') IS NOT NULL
+                   AND EXISTS (SELECT 1 FROM pg_trigger
+                               WHERE tgname = 'trg_series_date_stats' AND tgrelid = 'episodes'::regclass) THEN
+                    IF EXISTS (SELECT 1 FROM series_date_stats) OR NOT EXISTS (SELECT 1 FROM episodes) THEN
+                        RETURN;
+                    END IF;
+                END IF;
+                
+                LOCK TABLE episodes IN SHARE ROW EXCLUSIVE MODE;
+                CREATE TABLE IF NOT EXISTS series_date_stats (
+                    imdb_id VARCHAR(20) PRIMARY KEY,
+                    total_eps INTEGER NOT NULL DEFAULT 0,
+                    eps_with_dates INTEGER NOT NULL DEFAULT 0,
+                    eps_with_video INTEGER NOT NULL DEFAULT 0
+                );
+                has_trigger := EXISTS (SELECT 1 FROM pg_trigger
+                                       WHERE tgname = 'trg_series_date_stats' AND tgrelid = 'episodes'::regclass);
+                -- Without the trigger any existing counts may be stale, so recount
+                IF NOT has_trigger OR NOT EXISTS (SELECT 1 FROM series_date_stats) THEN
+                    DELETE FROM series_date_stats;
+                    INSERT INTO series_date_stats (imdb_id, total_eps, eps_with_dates, eps_with_video)
+                    SELECT imdb_id,
+                           COUNT(*),
+                           COUNT(*) FILTER (WHERE dateadded IS NOT NULL),
+                           COUNT(*) FILTER (WHERE has_video_file)
+                    FROM episodes
+                    GROUP BY imdb_id;
+                END IF;
+                IF NOT has_trigger THEN
+                    CREATE TRIGGER trg_series_date_stats
+                        AFTER INSERT OR UPDATE OR DELETE ON episodes
+                        FOR EACH ROW EXECUTE FUNCTION series_date_stats_sync();
+                END IF;
+            END
+            $$
+        """)
+    
     def upsert_series(self, imdb_id: str, path: str, metadata: Optional[Dict] = None):
         """Insert or update series record"""
         with self.get_connection() as conn:
@@ -231,10 +447,7 @@ class NFOGuardDatabase:
         """Get episode date record"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM episodes 
-                WHERE imdb_id = %s AND season = %s AND episode = %s
-            """, (imdb_id, season, episode))
+            self.execute_prepared(cursor, "get_episode_date", (imdb_id, season, episode))
             
             row = cursor.fetchone()
             return dict(row) if row else None
@@ -243,7 +456,7 @@ class NFOGuardDatabase:
         """Get movie date record"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM movies WHERE imdb_id = %s", (imdb_id,))
+            self.execute_prepared(cursor, "get_movie_dates", (imdb_id,))
             
             row = cursor.fetchone()
             return dict(row) if row else None
@@ -258,6 +471,52 @@ class NFOGuardDatabase:
             """, (imdb_id, media_type, event_type, datetime.utcnow().isoformat(), 
                   json.dumps(details) if details else None))
     
+    def bulk_update_source(self, media_type: str, old_source: str, new_source: str) -> int:
+        """
+        Change the source of all movies or episodes and record processing history
+        
+        The update and the per-row history entries are written in one statement;
+        history details are built server-side with jsonb_build_object.
+        
+        Args:
+            media_type: "movies" or "episodes"
+            old_source: Source value to replace
+            new_source: Replacement source value
+            
+        Returns:
+            Number of rows updated
+        """
+        if media_type == "movies":
+            query = """
+                WITH updated AS (
+                    UPDATE movies SET source = %s WHERE source = %s
+                    RETURNING imdb_id
+                )
+                INSERT INTO processing_history (imdb_id, media_type, event_type, processed_at, details)
+                SELECT imdb_id, 'movie', 'bulk_source_update', NOW() AT TIME ZONE 'UTC',
+                       jsonb_build_object('old_source', %s::text, 'new_source', %s::text)::text
+                FROM updated
+            """
+        elif media_type == "episodes":
+            query = """
+                WITH updated AS (
+                    UPDATE episodes SET source = %s WHERE source = %s
+                    RETURNING imdb_id, season, episode
+                )
+                INSERT INTO processing_history (imdb_id, media_type, event_type, processed_at, details)
+                SELECT imdb_id, 'episode', 'bulk_source_update', NOW() AT TIME ZONE 'UTC',
+                       jsonb_build_object('season', season, 'episode', episode,
+                                          'old_source', %s::text, 'new_source', %s::text)::text
+                FROM updated
+            """
+        else:
+            raise ValueError(f"Unsupported media_type: {media_type}")
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, (new_source, old_source, old_source, new_source))
+            return cursor.rowcount
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         with self.get_connection() as conn:
@@ -566,5 +825,6 @@ class NFOGuardDatabase:
             try:
                 self._local.connection.close()
                 delattr(self._local, 'connection')
+                self._local.prepared = set()
             except Exception:
                 pass  # Connection may already be closed
\ No newline at end of file
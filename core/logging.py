@@ -23,8 +23,22 @@ def _get_local_timezone():
         # If zone name is invalid, fallback to UTC
         return timezone.utc
 
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# LOG_LEVEL sets the minimum level printed; without it DEBUG=true shows debug lines
+_MIN_LEVEL = _LEVELS.get(
+    os.environ.get("LOG_LEVEL", "DEBUG" if os.environ.get("DEBUG", "false").lower() == "true" else "INFO").upper(),
+    _LEVELS["INFO"]
+)
+
+def _log_enabled(level: str) -> bool:
+    """Whether _log prints messages of this level; check before building costly messages"""
+    return _LEVELS.get(level, _LEVELS["INFO"]) >= _MIN_LEVEL
+
 def _log(level: str, msg: str):
     """Basic logging function that writes to console"""
+    if not _log_enabled(level):
+        return
     tz = _get_local_timezone()
     print(f"[{datetime.now(tz).isoformat(timespec='seconds')}] {level}: {msg}")
 
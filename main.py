@@ -24,6 +24,7 @@ from utils.logging import _log
 from core.database import NFOGuardDatabase
 from core.nfo_manager import NFOManager
 from core.path_mapper import PathMapper
+from utils.file_utils import MediaPathIndex
 
 # Import clients
 from clients.external_clients import ExternalClientManager
@@ -96,9 +97,12 @@ def initialize_components():
     nfo_manager = NFOManager(config.manager_brand, config.debug)
     path_mapper = PathMapper(config)
     
+    # One set of external API clients shared by both processors
+    external_clients = ExternalClientManager()
+    
     # Initialize processors
-    tv_processor = TVProcessor(db, nfo_manager, path_mapper)
-    movie_processor = MovieProcessor(db, nfo_manager, path_mapper)
+    tv_processor = TVProcessor(db, nfo_manager, path_mapper, external_clients)
+    movie_processor = MovieProcessor(db, nfo_manager, path_mapper, external_clients)
     
     # Initialize webhook batcher with nfo_manager for comprehensive IMDb detection
     batcher = WebhookBatcher(nfo_manager)
@@ -108,6 +112,8 @@ def initialize_components():
         "db": db,
         "nfo_manager": nfo_manager,
         "path_mapper": path_mapper,
+        "series_path_index": MediaPathIndex(config.tv_paths),
+        "external_clients": external_clients,
         "tv_processor": tv_processor,
         "movie_processor": movie_processor,
         "batcher": batcher,
@@ -137,6 +143,20 @@ def signal_handler(signum, frame):
             except Exception as e:
                 _log("WARNING", f"Error during batcher shutdown: {e}")
         
+        # Close pooled Sonarr connections
+        if 'tv_processor' in deps:
+            try:
+                deps['tv_processor'].sonarr.close()
+            except Exception as e:
+                _log("WARNING", f"Error closing Sonarr session: {e}")
+        
+        # Close pooled Radarr API and database connections
+        if 'movie_processor' in deps:
+            try:
+                deps['movie_processor'].radarr.close()
+            except Exception as e:
+                _log("WARNING", f"Error closing Radarr connections: {e}")
+        
         # Close database connection
         if 'db' in deps:
             try:
@@ -216,6 +236,12 @@ def main():
                 except Exception:
                     pass
             
+            if 'movie_processor' in deps:
+                try:
+                    deps['movie_processor'].radarr.close()
+                except Exception:
+                    pass
+            
             if 'db' in deps:
                 try:
                     deps['db'].close()
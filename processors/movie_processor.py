@@ -68,7 +68,8 @@ def convert_utc_to_local(utc_iso_string: str) -> str:
 class MovieProcessor:
     """Handles movie processing"""
     
-    def __init__(self, db: NFOGuardDatabase, nfo_manager: NFOManager, path_mapper: PathMapper):
+    def __init__(self, db: NFOGuardDatabase, nfo_manager: NFOManager, path_mapper: PathMapper,
+                 external_clients: ExternalClientManager = None):
         self.db = db
         self.nfo_manager = nfo_manager
         self.path_mapper = path_mapper
@@ -76,7 +77,7 @@ class MovieProcessor:
             os.environ.get("RADARR_URL", ""),
             os.environ.get("RADARR_API_KEY", "")
         )
-        self.external_clients = ExternalClientManager()
+        self.external_clients = external_clients or ExternalClientManager()
     
     def find_movie_path(self, movie_title: str, imdb_id: str, radarr_path: str = None) -> Optional[Path]:
         """Find movie directory path using unified file utilities"""
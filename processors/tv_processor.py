@@ -32,7 +32,8 @@ from utils.async_file_utils import (
 class TVProcessor:
     """Handles TV series processing"""
     
-    def __init__(self, db: NFOGuardDatabase, nfo_manager: NFOManager, path_mapper: PathMapper):
+    def __init__(self, db: NFOGuardDatabase, nfo_manager: NFOManager, path_mapper: PathMapper,
+                 external_clients: ExternalClientManager = None):
         self.db = db
         self.nfo_manager = nfo_manager
         self.async_nfo_manager = AsyncNFOManager(config.manager_brand, config.debug)
@@ -41,7 +42,7 @@ class TVProcessor:
             os.environ.get("SONARR_URL", ""),
             os.environ.get("SONARR_API_KEY", "")
         )
-        self.external_clients = ExternalClientManager()
+        self.external_clients = external_clients or ExternalClientManager()
     
     def find_series_path(self, series_title: str, imdb_id: str, sonarr_path: str = None) -> Optional[Path]:
         """Find series directory path using unified file utilities"""
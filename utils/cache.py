@@ -0,0 +1,202 @@
+"""
+Small in-process caching helpers for NFOGuard
+"""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import orjson
+
+from utils.logging import _log
+
+
+class _InflightCall:
+    """Result slot shared by threads waiting on the same cache miss"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion
+
+    Used to keep the results of slow external lookups (Radarr, Sonarr, TMDB,
+    OMDb) around between requests. Once ``maxsize`` entries are stored the
+    least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, _InflightCall] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, optionally overriding the default TTL"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key from the cache and return its value"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else default
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._data.clear()
+
+    def get_or_call(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Return the cached value for key, calling fn(*args, **kwargs) on a miss
+
+        Concurrent misses for the same key are coalesced: the first caller
+        runs fn and the others wait for its result instead of repeating the
+        lookup. Empty results (None, {}, []) are handed to the waiting callers
+        but not cached, so failed lookups are retried on the next miss.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InflightCall()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn(*args, **kwargs)
+            if call.value:
+                self.set(key, call.value)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    Persistent key/value cache stored in a SQLite file
+
+    Keeps external API responses across restarts so the same lookups are not
+    repeated on every scan. Values are stored as JSON and expire ``ttl``
+    seconds after they were written. If the database can't be opened the
+    cache stays disabled and every lookup is a miss.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if not path:
+            return
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            _log("WARNING", f"Response cache disabled, could not open {path}: {e}")
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def get(self, key: str) -> Any:
+        """Return the stored value for key, or None if missing or expired"""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] < time.time():
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+            return orjson.loads(row[0])
+        except (sqlite3.Error, orjson.JSONDecodeError) as e:
+            _log("DEBUG", f"Response cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds"""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(value), time.time() + ttl),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError) as e:
+            _log("DEBUG", f"Response cache write failed: {e}")
+
+
+def cached_call(cache: TTLCache, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+    """
+    Return the cached result for key, calling fn on a miss
+
+    Empty results (None, {}, []) are not cached so failed lookups are
+    retried on the next call. Concurrent misses for the same key share a
+    single call to fn (see TTLCache.get_or_call).
+
+    Args:
+        cache: Cache to read from and populate
+        key: Cache key for this call
+        fn: Function producing the value on a miss
+
+    Returns:
+        Cached or freshly computed value
+    """
+    return cache.get_or_call(key, fn, *args, **kwargs)
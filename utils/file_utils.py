@@ -4,6 +4,7 @@ Common file operations to eliminate code duplication
 """
 import glob
 import re
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple, Union
 
@@ -231,6 +232,59 @@ def extract_imdb_id_from_path(path: Union[str, Path]) -> Optional[str]:
     return None
 
 
+class MediaPathIndex:
+    """
+    Cached IMDb ID -> media directory index for a set of library roots
+    
+    Replaces per-lookup directory scans with a dict lookup. The index is
+    built lazily, rebuilt once it is older than ``ttl`` seconds, and rebuilt
+    early on a cache miss (at most once per ``miss_rebuild_interval``
+    seconds) so newly added directories are picked up quickly.
+    """
+    
+    def __init__(self, search_paths: List[Path], ttl: float = 300.0, miss_rebuild_interval: float = 30.0):
+        self.search_paths = search_paths
+        self.ttl = ttl
+        self.miss_rebuild_interval = miss_rebuild_interval
+        self._index: Dict[str, Path] = {}
+        self._built_at: Optional[float] = None
+    
+    def _rebuild(self) -> None:
+        """Scan the library roots and rebuild the index"""
+        index = {}
+        for media_path in self.search_paths:
+            for item in safe_directory_scan(Path(media_path)):
+                if not item.is_dir():
+                    continue
+                imdb_id = extract_imdb_id_from_path(item.name)
+                if imdb_id:
+                    index.setdefault(imdb_id.lower(), item)
+        self._index = index
+        self._built_at = time.monotonic()
+    
+    def get(self, imdb_id: str) -> Optional[Path]:
+        """
+        Look up the media directory for an IMDb ID
+        
+        Args:
+            imdb_id: IMDb ID to look up
+            
+        Returns:
+            Path to media directory if found, None otherwise
+        """
+        key = imdb_id.lower()
+        age = time.monotonic() - self._built_at if self._built_at is not None else None
+        if age is None or age > self.ttl:
+            self._rebuild()
+        elif key not in self._index and age > self.miss_rebuild_interval:
+            self._rebuild()
+        return self._index.get(key)
+    
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup"""
+        self._built_at = None
+
+
 def is_video_file(file_path: Path) -> bool:
     """
     Check if a file is a video file based on extension